@@ -1,17 +1,9 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from streamlit_webrtc import webrtc_streamer, VideoProcessorBase, RTCConfiguration
-import cv2
-import mediapipe as mp
-import json
-import os
 import uuid
-import time
-from datetime import datetime
-from database.models import db_manager
+from database.models import get_db_manager
+
+# cv2, mediapipe, streamlit_webrtc and plotly are imported by the test/results
+# pages on demand, so the Overview page loads without them
 
 # Page configuration
 st.set_page_config(
@@ -43,9 +35,23 @@ def inject_global_styles():
         unsafe_allow_html=True,
     )
 
+@st.cache_resource
+def init_database():
+    """Create tables once per server process instead of on every rerun"""
+    db_manager = get_db_manager()
+    db_manager.create_tables()
+    return db_manager
+
+def get_or_create_user_id(session_id):
+    """Look up (or create) the user row for a browser session; lookups are cached in the DB layer"""
+    user_id = get_db_manager().get_user_id_by_session(session_id)
+    if user_id is None:
+        user_id = get_db_manager().create_user(session_id).id
+    return user_id
+
 # Initialize database
 try:
-    db_manager.create_tables()
+    init_database()
 except Exception as e:
     st.error(f"Database initialization error: {e}")
 
@@ -53,10 +59,7 @@ except Exception as e:
 if 'session_id' not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4())
 if 'user_id' not in st.session_state:
-    user = db_manager.get_user_by_session(st.session_state.session_id)
-    if not user:
-        user = db_manager.create_user(st.session_state.session_id)
-    st.session_state.user_id = user.id
+    st.session_state.user_id = get_or_create_user_id(st.session_state.session_id)
 if 'assessment_id' not in st.session_state:
     st.session_state.assessment_id = None
 if 'current_test' not in st.session_state:
@@ -185,7 +188,7 @@ def show_overview():
         if st.button("🚀 Start Behavioral Assessment", type="primary", use_container_width=True):
             # Create new assessment
             if not st.session_state.assessment_id:
-                assessment = db_manager.create_assessment(st.session_state.user_id, "behavioral_analysis")
+                assessment = get_db_manager().create_assessment(st.session_state.user_id, "behavioral_analysis")
                 st.session_state.assessment_id = assessment.id
             
             st.session_state.current_test = 1  # Go to first test
@@ -228,4 +231,6 @@ def show_results_analysis():
     show_results_analysis_page()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # One shared DB session for the whole run, handed back to the pool when it ends
+    with get_db_manager().run_scope():
+        main()
\ No newline at end of file
@@ -1,18 +1,47 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, JSON
+from sqlalchemy import create_engine, event, func, inspect, insert, select, text, update, Index, Column, Integer, String, Float, DateTime, Boolean, Text, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import expression
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.dialects.postgresql import JSONB
+from contextlib import contextmanager
+from functools import cache, lru_cache
+from operator import itemgetter
 from datetime import datetime
+import numpy as np
 import os
+import io
+import time
+import threading
+import csv
 import json
 
 Base = declarative_base()
 
+class utcnow(expression.FunctionElement):
+    """Current UTC time as a server-side default, matching datetime.utcnow"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+# Stored as binary JSONB on Postgres, plain JSON text elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 class User(Base):
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String, unique=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     age_group = Column(String)  # e.g., "18-24 months", "adult"
     consent_given = Column(Boolean, default=False)
@@ -21,13 +50,21 @@ class Assessment(Base):
     __tablename__ = "assessments"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, index=True)
+    user_id = Column(Integer)
     assessment_type = Column(String)  # "questionnaire", "gaze", "combined"
     status = Column(String, default="in_progress")  # "in_progress", "completed", "abandoned"
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, default=datetime.utcnow, index=True)
     completed_at = Column(DateTime)
     total_duration = Column(Integer)  # seconds
+    answers = Column(JSONType)  # {question_id: response_value}; question metadata lives in data/asd_questions.json
+    
+    __table_args__ = (
+        Index("ix_assess_user_started", "user_id", "started_at"),
+        # Also serves plain status filters, so no separate status index is needed
+        Index("ix_assessment_status_started", "status", started_at.desc()),
+    )
 
+# Legacy per-question rows, kept for auditing only; answers are written to Assessment.answers
 class QuestionnaireResponse(Base):
     __tablename__ = "questionnaire_responses"
     
@@ -40,40 +77,110 @@ class QuestionnaireResponse(Base):
     domain = Column(String)  # "social_communication", "autism_traits", etc.
     weight = Column(Float)
     is_critical_item = Column(Boolean, default=False)
-    answered_at = Column(DateTime, default=datetime.utcnow)
+    # Python default for databases created before the server default existed
+    answered_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
 
 class GazeData(Base):
     __tablename__ = "gaze_data"
     
     id = Column(Integer, primary_key=True, index=True)
-    assessment_id = Column(Integer, index=True)
+    assessment_id = Column(Integer)
     task_name = Column(String)
     task_type = Column(String)
     frame_number = Column(Integer)
-    timestamp = Column(Float)
+    timestamp = Column(Float)  # epoch seconds, needs double precision
     face_detected = Column(Boolean)
-    gaze_x = Column(Float)
-    gaze_y = Column(Float)
-    eye_contact_score = Column(Float)
-    fixation_duration = Column(Float)
-    saccade_amplitude = Column(Float)
-    social_attention_score = Column(Float)
-    recorded_at = Column(DateTime, default=datetime.utcnow)
+    # Per-frame metrics are stored single precision (REAL) to halve row width
+    gaze_x = Column(Float(precision=24))
+    gaze_y = Column(Float(precision=24))
+    eye_contact_score = Column(Float(precision=24))
+    fixation_duration = Column(Float(precision=24))
+    saccade_amplitude = Column(Float(precision=24))
+    social_attention_score = Column(Float(precision=24))
+    recorded_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    
+    __table_args__ = (
+        Index("ix_gaze_assess_task", "assessment_id", "task_name"),
+    )
+
+class GazeAggregate(Base):
+    __tablename__ = "gaze_aggregates"
+    
+    # Per-frame gaze collapsed into GAZE_BUCKET_SECONDS buckets per task; analytics read these
+    id = Column(Integer, primary_key=True, index=True)
+    assessment_id = Column(Integer)
+    task_name = Column(String)
+    task_type = Column(String)
+    bucket_start = Column(Float)  # epoch seconds
+    samples = Column(Integer)
+    face_detected_ratio = Column(Float(precision=24))
+    avg_eye_contact = Column(Float(precision=24))
+    avg_social_attention = Column(Float(precision=24))
+    avg_fixation_duration = Column(Float(precision=24))
+    max_fixation_duration = Column(Float(precision=24))
+    
+    __table_args__ = (
+        Index("ix_gaze_agg_assess_bucket", "assessment_id", "bucket_start"),
+    )
+
+# Width of the gaze aggregation buckets
+GAZE_BUCKET_SECONDS = 1.0
+
+# Per-frame gaze rows are only kept in gaze_data when this is set (debugging)
+STORE_RAW_GAZE = os.getenv("STORE_RAW_GAZE", "").lower() in ("1", "true", "yes")
+
+# Column order for the Postgres COPY fast path in save_gaze_data_batch
+GAZE_COPY_COLUMNS = (
+    "assessment_id", "task_name", "task_type", "frame_number", "timestamp", "face_detected",
+    "gaze_x", "gaze_y", "eye_contact_score", "fixation_duration", "saccade_amplitude",
+    "social_attention_score",
+)
+
+# Per-frame fields read from raw gaze dicts, with the value used when a key is missing
+GAZE_POINT_DEFAULTS = {
+    "timestamp": 0, "face_detected": False, "gaze_x": 0, "gaze_y": 0,
+    "eye_contact_score": 0, "fixation_duration": 0, "saccade_amplitude": 0,
+    "social_attention_score": 0,
+}
+GAZE_POINT_KEYS = tuple(GAZE_POINT_DEFAULTS)
+_get_gaze_point_fields = itemgetter(*GAZE_POINT_KEYS)
 
 class AssessmentResult(Base):
     __tablename__ = "assessment_results"
     
     id = Column(Integer, primary_key=True, index=True)
     assessment_id = Column(Integer, index=True)
-    questionnaire_scores = Column(JSON)  # Domain scores from questionnaire
-    gaze_metrics = Column(JSON)  # Aggregated gaze analysis metrics
-    ml_prediction = Column(JSON)  # Machine learning model results
-    risk_assessment = Column(JSON)  # Risk level and factors
-    recommendations = Column(JSON)  # Generated recommendations
+    questionnaire_scores = Column(JSONType)  # Domain scores from questionnaire
+    gaze_metrics = Column(JSONType)  # Aggregated gaze analysis metrics
+    ml_prediction = Column(JSONType)  # Machine learning model results
+    risk_assessment = Column(JSONType)  # Risk level and factors
+    recommendations = Column(JSONType)  # Generated recommendations
     overall_score = Column(Float)
-    risk_level = Column(String)  # "low", "moderate", "elevated"
+    risk_level = Column(String, index=True)  # "low", "moderate", "elevated"
     confidence_score = Column(Float)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so dashboard reads don't block gaze writes, and keep temp data/pages in memory"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+def _json_default(value):
+    """Let stdlib json encode NumPy scalars and arrays"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _json_dumps(value):
+    """Serializer for JSON columns that also accepts NumPy values"""
+    return json.dumps(value, default=_json_default)
 
 class DatabaseManager:
     def __init__(self):
@@ -87,8 +194,12 @@ class DatabaseManager:
             self.database_url = f"sqlite:///{sqlite_path}"
             os.environ["DATABASE_URL"] = self.database_url
 
+        in_memory = self.database_url.startswith("sqlite") and (
+            ":memory:" in self.database_url or self.database_url in ("sqlite://", "sqlite:///")
+        )
+
         # If using SQLite, ensure the target directory exists (helps on Render disk mounts)
-        if self.database_url.startswith("sqlite"):
+        if self.database_url.startswith("sqlite") and not in_memory:
             # sqlite:///relative or sqlite:////absolute
             path_part = self.database_url.split("sqlite:///")[-1]
             if path_part:
@@ -99,153 +210,307 @@ class DatabaseManager:
                     target_dir = os.path.join(project_root, target_dir)
                 os.makedirs(target_dir, exist_ok=True)
 
-        connect_args = {"check_same_thread": False} if self.database_url.startswith("sqlite") else {}
-        self.engine = create_engine(self.database_url, connect_args=connect_args, future=True)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        if self.database_url.startswith("sqlite"):
+            engine_kwargs = {"connect_args": {"check_same_thread": False}}
+            if in_memory:
+                # Every session must share the single in-memory database
+                engine_kwargs["poolclass"] = StaticPool
+        else:
+            # Re-validate pooled connections that the server dropped while idle
+            engine_kwargs = {"pool_pre_ping": True,
+                             "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+                             "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+                             "pool_recycle": 1800,
+                             # Larger multi-VALUES pages for the gaze batch inserts
+                             "insertmanyvalues_page_size": 10000}
+        self.engine = create_engine(self.database_url, future=True,
+                                    json_serializer=_json_dumps,
+                                    **engine_kwargs)
+        if self.database_url.startswith("sqlite"):
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        # Keep committed objects loaded so reading .id afterwards doesn't trigger a SELECT
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+        # Thread-local session shared by every call within one Streamlit script run
+        self.Session = scoped_session(self.SessionLocal)
+        # Per-thread count of open session_scope()/run_scope() blocks using that session
+        self._session_holds = threading.local()
+        self._cached_user_id = lru_cache(maxsize=10000)(self._lookup_user_id)
         
     def create_tables(self):
         """Create all database tables"""
         Base.metadata.create_all(bind=self.engine)
+        # create_all skips columns and indexes on tables that already exist, so
+        # add any newly declared ones to previously deployed databases
+        inspector = inspect(self.engine)
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    with self.engine.begin() as conn:
+                        conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
     
     def get_session(self) -> Session:
         """Get database session"""
         return self.SessionLocal()
     
+    @contextmanager
+    def session_scope(self):
+        """Group several operations into one transaction on the shared session
+
+        The session is released on exit unless an enclosing run_scope() still holds it,
+        so calls from fragments, worker threads and standalone pages don't leak it.
+        """
+        db = self._hold_session()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            self._release_session()
+    
+    @contextmanager
+    def run_scope(self):
+        """Share one session across every call within a script run, then release it"""
+        self._hold_session()
+        try:
+            yield
+        finally:
+            self._release_session()
+    
+    def _hold_session(self) -> Session:
+        self._session_holds.depth = getattr(self._session_holds, 'depth', 0) + 1
+        return self.Session()
+    
+    def _release_session(self):
+        self._session_holds.depth -= 1
+        if self._session_holds.depth == 0:
+            self.Session.remove()
+    
+    def remove_session(self):
+        """Close and discard the current thread's shared session"""
+        self.Session.remove()
+    
     def create_user(self, session_id: str, age_group: str = None, consent_given: bool = False) -> User:
         """Create a new user session"""
-        db = self.get_session()
-        try:
+        with self.session_scope() as db:
             user = User(
                 session_id=session_id,
                 age_group=age_group,
                 consent_given=consent_given
             )
             db.add(user)
-            db.commit()
-            db.refresh(user)
-            return user
-        finally:
-            db.close()
+        return user
     
-    def get_user_by_session(self, session_id: str) -> User:
-        """Get user by session ID"""
-        db = self.get_session()
+    def get_user_id_by_session(self, session_id: str):
+        """Resolve a session id to its user id, memoized per process; None if unknown"""
         try:
-            return db.query(User).filter(User.session_id == session_id).first()
-        finally:
-            db.close()
+            return self._cached_user_id(session_id)
+        except LookupError:
+            return None
+    
+    def _lookup_user_id(self, session_id: str) -> int:
+        # Raising on a miss keeps lru_cache from remembering sessions that don't exist yet
+        with self.session_scope() as db:
+            user_id = db.query(User.id).filter(User.session_id == session_id).scalar()
+        if user_id is None:
+            raise LookupError(session_id)
+        return user_id
+    
+    def clear_user_cache(self):
+        """Forget memoized session -> user ids (call after deleting users)"""
+        self._cached_user_id.cache_clear()
     
     def create_assessment(self, user_id: int, assessment_type: str) -> Assessment:
         """Create a new assessment"""
-        db = self.get_session()
-        try:
+        with self.session_scope() as db:
             assessment = Assessment(
                 user_id=user_id,
                 assessment_type=assessment_type
             )
             db.add(assessment)
-            db.commit()
-            db.refresh(assessment)
-            return assessment
-        finally:
-            db.close()
-    
-    def save_questionnaire_response(self, assessment_id: int, question_id: str, 
-                                  question_text: str, response_value: float,
-                                  response_text: str = None, domain: str = None,
-                                  weight: float = 1.0, is_critical_item: bool = False):
-        """Save a questionnaire response"""
-        db = self.get_session()
-        try:
-            response = QuestionnaireResponse(
-                assessment_id=assessment_id,
-                question_id=question_id,
-                question_text=question_text,
-                response_value=response_value,
-                response_text=response_text,
-                domain=domain,
-                weight=weight,
-                is_critical_item=is_critical_item
-            )
-            db.add(response)
-            db.commit()
-            return response
-        finally:
-            db.close()
+        return assessment
+    
+    def create_session_and_assessment(self, session_id: str, assessment_type: str,
+                                      age_group: str = None) -> tuple:
+        """Create a user and their first assessment in one transaction; returns (user_id, assessment_id)"""
+        # Core INSERT ... RETURNING hands back each id from the insert itself,
+        # skipping the ORM unit-of-work flush
+        with self.session_scope() as db:
+            user_id = db.execute(
+                insert(User).values(session_id=session_id, age_group=age_group)
+                .returning(User.id)
+            ).scalar_one()
+            assessment_id = db.execute(
+                insert(Assessment).values(user_id=user_id, assessment_type=assessment_type)
+                .returning(Assessment.id)
+            ).scalar_one()
+        return user_id, assessment_id
+    
+    def save_answers(self, assessment_id: int, answers: dict):
+        """Store all questionnaire answers for an assessment in one UPDATE"""
+        with self.session_scope() as db:
+            db.execute(update(Assessment).where(Assessment.id == assessment_id).values(answers=answers))
+        return len(answers)
     
     def save_gaze_data_batch(self, assessment_id: int, task_name: str, task_type: str, 
                            gaze_data_list):
-        """Save gaze data. Accepts a list of raw gaze dicts or a single aggregate dict."""
-        db = self.get_session()
+        """Save gaze data. Accepts raw gaze dicts, a structured gaze array, or a single aggregate dict.
+        
+        Per-frame input is stored as one-second aggregates, plus raw gaze_data rows if STORE_RAW_GAZE.
+        """
+        # If an aggregate dict was provided, store a single summary row
+        if isinstance(gaze_data_list, dict):
+            summary = gaze_data_list
+            samples = summary.get('total_frames') or summary.get('frame_count') or 0
+            eye_contact = summary.get('face_detection_rate', 0)
+            social_attention = (
+                summary.get('social_attention_score')
+                or summary.get('social_attention_ratio')
+                or summary.get('face_preference_ratio')
+                or 0
+            )
+            rows = [{
+                'assessment_id': assessment_id,
+                'task_name': task_name,
+                'task_type': task_type,
+                'frame_number': samples,
+                'timestamp': summary.get('timestamp', 0),
+                'face_detected': bool(summary.get('face_detected_frames', 0) > 0),
+                'gaze_x': summary.get('avg_gaze_x', 0),
+                'gaze_y': summary.get('avg_gaze_y', 0),
+                'eye_contact_score': eye_contact,
+                'fixation_duration': summary.get('avg_fixation_duration', 0),
+                'saccade_amplitude': summary.get('gaze_velocity_std', 0),
+                'social_attention_score': social_attention
+            }]
+            aggregate_rows = [{
+                'assessment_id': assessment_id,
+                'task_name': task_name,
+                'task_type': task_type,
+                'bucket_start': summary.get('timestamp') or time.time(),
+                'samples': max(samples, 1),
+                'face_detected_ratio': summary.get('face_detection_rate', 0),
+                'avg_eye_contact': eye_contact,
+                'avg_social_attention': social_attention,
+                'avg_fixation_duration': summary.get('avg_fixation_duration', 0),
+                'max_fixation_duration': summary.get('avg_fixation_duration', 0)
+            }]
+        elif isinstance(gaze_data_list, np.ndarray):
+            aggregate_rows = self._bucket_gaze_frames(
+                assessment_id, task_name, task_type,
+                {name: gaze_data_list[name] for name in gaze_data_list.dtype.names}
+            )
+            rows = []
+            if STORE_RAW_GAZE:
+                # Structured GAZE_DTYPE array: one tolist() converts every field to Python scalars
+                names = gaze_data_list.dtype.names
+                rows = [
+                    dict(zip(names, record), assessment_id=assessment_id, task_name=task_name,
+                         task_type=task_type, frame_number=i)
+                    for i, record in enumerate(gaze_data_list.tolist())
+                ]
+        else:
+            # Otherwise treat as iterable of raw gaze datapoints; one itemgetter call
+            # per frame pulls every field, with defaults merged in for missing keys
+            points = [_get_gaze_point_fields({**GAZE_POINT_DEFAULTS, **data_point})
+                      for data_point in gaze_data_list]
+            columns = np.array(points, dtype=np.float64).reshape(-1, len(GAZE_POINT_KEYS)).T
+            aggregate_rows = self._bucket_gaze_frames(
+                assessment_id, task_name, task_type, dict(zip(GAZE_POINT_KEYS, columns))
+            )
+            rows = []
+            if STORE_RAW_GAZE:
+                rows = [
+                    dict(zip(GAZE_POINT_KEYS, point), assessment_id=assessment_id, task_name=task_name,
+                         task_type=task_type, frame_number=i)
+                    for i, point in enumerate(points)
+                ]
+        
+        if aggregate_rows:
+            with self.session_scope() as db:
+                db.execute(GazeAggregate.__table__.insert(), aggregate_rows)
+        
+        if rows and self.engine.dialect.driver == "psycopg2":
+            self._copy_gaze_rows(rows)
+        elif rows:
+            # Single executemany through Core, bypassing ORM identity-map bookkeeping
+            with self.session_scope() as db:
+                db.execute(GazeData.__table__.insert(), rows)
+        return len(rows) + len(aggregate_rows)
+    
+    def _bucket_gaze_frames(self, assessment_id: int, task_name: str, task_type: str, frames: dict) -> list:
+        """Collapse per-frame gaze columns (field name -> array) into one row per time bucket"""
+        timestamps = np.asarray(frames['timestamp'], dtype=np.float64)
+        if not len(timestamps):
+            return []
+        
+        buckets, inverse, counts = np.unique(np.floor(timestamps / GAZE_BUCKET_SECONDS),
+                                             return_inverse=True, return_counts=True)
+        
+        def bucket_mean(name):
+            return np.bincount(inverse, weights=np.asarray(frames[name], dtype=np.float64),
+                               minlength=len(buckets)) / counts
+        
+        max_fixation = np.full(len(buckets), -np.inf)
+        np.maximum.at(max_fixation, inverse, np.asarray(frames['fixation_duration'], dtype=np.float64))
+        
+        columns = zip(
+            (buckets * GAZE_BUCKET_SECONDS).tolist(), counts.tolist(),
+            bucket_mean('face_detected').tolist(), bucket_mean('eye_contact_score').tolist(),
+            bucket_mean('social_attention_score').tolist(), bucket_mean('fixation_duration').tolist(),
+            max_fixation.tolist()
+        )
+        return [
+            {
+                'assessment_id': assessment_id, 'task_name': task_name, 'task_type': task_type,
+                'bucket_start': bucket_start, 'samples': samples, 'face_detected_ratio': face_ratio,
+                'avg_eye_contact': eye_contact, 'avg_social_attention': social_attention,
+                'avg_fixation_duration': avg_fixation, 'max_fixation_duration': max_fix
+            }
+            for bucket_start, samples, face_ratio, eye_contact, social_attention, avg_fixation, max_fix in columns
+        ]
+    
+    def _copy_gaze_rows(self, rows: list):
+        """Stream gaze rows into Postgres with COPY FROM STDIN instead of INSERT"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([row[column] for column in GAZE_COPY_COLUMNS] for row in rows)
+        buffer.seek(0)
+        
+        raw_connection = self.engine.raw_connection()
         try:
-            # If an aggregate dict was provided, store a single summary row
-            if isinstance(gaze_data_list, dict):
-                summary = gaze_data_list
-                gaze_record = GazeData(
-                    assessment_id=assessment_id,
-                    task_name=task_name,
-                    task_type=task_type,
-                    frame_number=summary.get('total_frames') or summary.get('frame_count') or 0,
-                    timestamp=summary.get('timestamp', 0),
-                    face_detected=bool(summary.get('face_detected_frames', 0) > 0),
-                    gaze_x=summary.get('avg_gaze_x', 0),
-                    gaze_y=summary.get('avg_gaze_y', 0),
-                    eye_contact_score=summary.get('face_detection_rate', 0),
-                    fixation_duration=summary.get('avg_fixation_duration', 0),
-                    saccade_amplitude=summary.get('gaze_velocity_std', 0),
-                    social_attention_score=(
-                        summary.get('social_attention_score')
-                        or summary.get('social_attention_ratio')
-                        or summary.get('face_preference_ratio')
-                        or 0
-                    )
-                )
-                db.add(gaze_record)
-                db.commit()
-                return 1
-            
-            # Otherwise treat as iterable of raw gaze datapoints
-            gaze_records = []
-            for i, data_point in enumerate(gaze_data_list):
-                gaze_record = GazeData(
-                    assessment_id=assessment_id,
-                    task_name=task_name,
-                    task_type=task_type,
-                    frame_number=i,
-                    timestamp=data_point.get('timestamp', 0),
-                    face_detected=data_point.get('face_detected', False),
-                    gaze_x=data_point.get('gaze_x', 0),
-                    gaze_y=data_point.get('gaze_y', 0),
-                    eye_contact_score=data_point.get('eye_contact_score', 0),
-                    fixation_duration=data_point.get('fixation_duration', 0),
-                    saccade_amplitude=data_point.get('saccade_amplitude', 0),
-                    social_attention_score=data_point.get('social_attention_score', 0)
-                )
-                gaze_records.append(gaze_record)
-            
-            if gaze_records:
-                db.add_all(gaze_records)
-                db.commit()
-            return len(gaze_records)
+            cursor = raw_connection.cursor()
+            cursor.copy_expert(
+                f"COPY {GazeData.__tablename__} ({', '.join(GAZE_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            cursor.close()
+            raw_connection.commit()
+        except Exception:
+            raw_connection.rollback()
+            raise
         finally:
-            db.close()
+            raw_connection.close()
     
     def save_assessment_results(self, assessment_id: int, overall_scores: dict,
                               behavioral_patterns: dict, meta: dict,
                               risk_indicators: dict, recommendations: list):
         """Save final assessment results from comprehensive analysis."""
-        db = self.get_session()
-        try:
-            # Derive summary scoring
-            overall_score_value = 0.0
-            if overall_scores:
-                try:
-                    overall_score_value = float(sum(overall_scores.values())) / max(len(overall_scores), 1)
-                except Exception:
-                    overall_score_value = 0.0
-            risk_level_value = (meta or {}).get('overall_risk_level', 'unknown')
-            confidence_value = float((meta or {}).get('confidence_level', 0))
-            
+        # Derive summary scoring
+        overall_score_value = 0.0
+        if overall_scores:
+            try:
+                overall_score_value = float(sum(overall_scores.values())) / max(len(overall_scores), 1)
+            except Exception:
+                overall_score_value = 0.0
+        risk_level_value = (meta or {}).get('overall_risk_level', 'unknown')
+        confidence_value = float((meta or {}).get('confidence_level', 0))
+        
+        with self.session_scope() as db:
             result = AssessmentResult(
                 assessment_id=assessment_id,
                 questionnaire_scores={},
@@ -258,16 +523,11 @@ class DatabaseManager:
                 confidence_score=confidence_value
             )
             db.add(result)
-            db.commit()
-            db.refresh(result)
-            return result
-        finally:
-            db.close()
+        return result
     
     def complete_assessment(self, assessment_id: int):
         """Mark assessment as completed"""
-        db = self.get_session()
-        try:
+        with self.session_scope() as db:
             assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
             if assessment:
                 assessment.status = "completed"
@@ -275,45 +535,36 @@ class DatabaseManager:
                 if assessment.started_at:
                     duration = (datetime.utcnow() - assessment.started_at).total_seconds()
                     assessment.total_duration = int(duration)
-                db.commit()
                 return assessment
-        finally:
-            db.close()
     
     def get_assessment_results(self, assessment_id: int) -> AssessmentResult:
         """Get assessment results"""
-        db = self.get_session()
-        try:
+        with self.session_scope() as db:
             return db.query(AssessmentResult).filter(
                 AssessmentResult.assessment_id == assessment_id
             ).first()
-        finally:
-            db.close()
     
     def get_user_assessments(self, user_id: int) -> list:
         """Get all assessments for a user"""
-        db = self.get_session()
-        try:
+        with self.session_scope() as db:
             return db.query(Assessment).filter(Assessment.user_id == user_id).all()
-        finally:
-            db.close()
     
     def get_assessment_statistics(self) -> dict:
         """Get general statistics about assessments"""
-        db = self.get_session()
-        try:
-            total_users = db.query(User).count()
-            total_assessments = db.query(Assessment).count()
-            completed_assessments = db.query(Assessment).filter(
-                Assessment.status == "completed"
-            ).count()
+        with self.session_scope() as db:
+            # All headline counts in one round-trip; risk levels are grouped by the database
+            total_users, total_assessments, completed_assessments = db.query(
+                select(func.count(User.id)).scalar_subquery(),
+                func.count(Assessment.id),
+                func.count(Assessment.id).filter(Assessment.status == "completed"),
+            ).one()
             
-            # Risk level distribution
-            risk_levels = db.query(AssessmentResult.risk_level).all()
-            risk_distribution = {}
-            for level in risk_levels:
-                if level[0]:
-                    risk_distribution[level[0]] = risk_distribution.get(level[0], 0) + 1
+            risk_distribution = dict(
+                db.query(AssessmentResult.risk_level, func.count(AssessmentResult.id))
+                .filter(AssessmentResult.risk_level.isnot(None), AssessmentResult.risk_level != "")
+                .group_by(AssessmentResult.risk_level)
+                .all()
+            )
             
             return {
                 "total_users": total_users,
@@ -322,8 +573,37 @@ class DatabaseManager:
                 "completion_rate": completed_assessments / max(total_assessments, 1),
                 "risk_distribution": risk_distribution
             }
-        finally:
-            db.close()
+    
+    def delete_sessions_before(self, cutoff: datetime) -> int:
+        """Delete users created before cutoff and everything attached to them; returns users deleted"""
+        old_user_ids = select(User.id).where(User.created_at < cutoff)
+        old_assessment_ids = select(Assessment.id).where(Assessment.user_id.in_(old_user_ids))
+        with self.session_scope() as db:
+            # One set-based DELETE per table, children first
+            for model in (QuestionnaireResponse, GazeData, GazeAggregate, AssessmentResult):
+                db.query(model).filter(model.assessment_id.in_(old_assessment_ids)).delete(synchronize_session=False)
+            db.query(Assessment).filter(Assessment.user_id.in_(old_user_ids)).delete(synchronize_session=False)
+            deleted = db.query(User).filter(User.created_at < cutoff).delete(synchronize_session=False)
+        self.clear_user_cache()
+        return deleted
+    
+    def get_table_counts(self) -> dict:
+        """Row counts for every table, fetched in a single query"""
+        tables = {
+            "users": User,
+            "assessments": Assessment,
+            "questionnaire_responses": QuestionnaireResponse,
+            "gaze_data": GazeData,
+            "gaze_aggregates": GazeAggregate,
+            "assessment_results": AssessmentResult,
+        }
+        with self.session_scope() as db:
+            counts = db.query(*[
+                select(func.count()).select_from(model).scalar_subquery() for model in tables.values()
+            ]).one()
+            return dict(zip(tables, counts))
 
-# Global database manager instance
-db_manager = DatabaseManager()
\ No newline at end of file
+@cache
+def get_db_manager() -> DatabaseManager:
+    """Return the process-wide database manager, creating the engine on first use"""
+    return DatabaseManager()
\ No newline at end of file
@@ -1,23 +1,68 @@
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.linear_model import LogisticRegression
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+from sklearn.calibration import CalibratedClassifierCV
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 import joblib
 import json
+import os
+import warnings
+
+# Fitted models, scaler and feature names, written after the first training run
+MODEL_CACHE = os.getenv(
+    "BEHAVIORAL_MODEL_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data", "behavioral_models.joblib")
+)
+
+# M-CHAT-R style questions (social communication)
+SOCIAL_QUESTIONS = frozenset([
+    'enjoys_being_swung', 'interest_in_other_children', 'enjoys_climbing',
+    'enjoys_peek_a_boo', 'pretend_play', 'uses_index_finger',
+    'brings_objects_to_show', 'eye_contact', 'unusual_finger_movements',
+    'tries_to_attract_attention'
+])
+
+# AQ-10 style questions (autism traits)
+AUTISM_TRAIT_QUESTIONS = frozenset([
+    'notices_small_sounds', 'concentrates_on_whole_picture', 'easy_to_do_several_things',
+    'enjoys_social_chit_chat', 'finds_easy_to_read_between_lines', 'knows_how_to_tell_stories',
+    'drawn_to_people', 'enjoys_social_activities', 'finds_easy_to_work_out_intentions',
+    'good_at_social_chit_chat'
+])
+
+# Synthetic training distributions per feature: (ASD mean, std), (typical mean, std)
+SYNTHETIC_FEATURE_DISTRIBUTIONS = {
+    'social_communication_score': ((15, 5), (25, 4)),  # Lower social communication in ASD
+    'autism_traits_score': ((25, 6), (12, 4)),  # Higher autism traits
+    'avg_fixation_duration': ((800, 200), (600, 150)),  # Longer fixations
+    'total_eye_contact': ((20, 10), (60, 15)),  # Less eye contact
+    'avg_social_attention': ((0.3, 0.1), (0.7, 0.1)),  # Lower social attention
+    'gaze_dispersion_x': ((100, 30), (60, 20)),  # More dispersed gaze
+    'gaze_dispersion_y': ((100, 30), (60, 20)),
+}
+
+# Per-sample gaze fields the model derives features from
+GAZE_FEATURE_KEYS = (
+    'fixation_duration', 'saccade_amplitude', 'eye_contact_duration',
+    'social_attention_score', 'gaze_x', 'gaze_y'
+)
 
 class BehavioralModel:
     def __init__(self):
         self.models = {
             'random_forest': RandomForestClassifier(n_estimators=100, random_state=42),
-            'gradient_boosting': GradientBoostingClassifier(n_estimators=100, random_state=42),
-            'logistic_regression': LogisticRegression(random_state=42)
+            # Histogram-binned boosting, sigmoid-calibrated so its probabilities average sensibly with RF's
+            'hist_gradient_boosting': CalibratedClassifierCV(
+                HistGradientBoostingClassifier(max_iter=200, early_stopping=True, random_state=42),
+                method='sigmoid', cv=3
+            )
         }
         self.scaler = StandardScaler()
         self.is_trained = False
         self.feature_names = []
+        self._feature_index = {}
         
     def prepare_features(self, questionnaire_data, gaze_data=None):
         """Prepare features from questionnaire and gaze data"""
@@ -28,7 +73,7 @@ class BehavioralModel:
         features.update(behavioral_scores)
         
         # Gaze features if available
-        if gaze_data and len(gaze_data) > 0:
+        if gaze_data is not None and len(gaze_data) > 0:
             gaze_features = self._calculate_gaze_features(gaze_data)
             features.update(gaze_features)
         
@@ -38,116 +83,97 @@ class BehavioralModel:
         """Calculate behavioral domain scores"""
         scores = {}
         
-        # M-CHAT-R style questions (social communication)
-        social_questions = [
-            'enjoys_being_swung', 'interest_in_other_children', 'enjoys_climbing',
-            'enjoys_peek_a_boo', 'pretend_play', 'uses_index_finger',
-            'brings_objects_to_show', 'eye_contact', 'unusual_finger_movements',
-            'tries_to_attract_attention'
-        ]
-        
-        # AQ-10 style questions (autism traits)
-        autism_trait_questions = [
-            'notices_small_sounds', 'concentrates_on_whole_picture', 'easy_to_do_several_things',
-            'enjoys_social_chit_chat', 'finds_easy_to_read_between_lines', 'knows_how_to_tell_stories',
-            'drawn_to_people', 'enjoys_social_activities', 'finds_easy_to_work_out_intentions',
-            'good_at_social_chit_chat'
-        ]
-        
         # Calculate domain scores
-        social_score = sum([questionnaire_data.get(q, 0) for q in social_questions if q in questionnaire_data])
-        autism_traits_score = sum([questionnaire_data.get(q, 0) for q in autism_trait_questions if q in questionnaire_data])
+        social_score = sum(v for q, v in questionnaire_data.items() if q in SOCIAL_QUESTIONS)
+        autism_traits_score = sum(v for q, v in questionnaire_data.items() if q in AUTISM_TRAIT_QUESTIONS)
         
         scores['social_communication_score'] = social_score
         scores['autism_traits_score'] = autism_traits_score
         scores['total_behavioral_score'] = social_score + autism_traits_score
         
         # Individual question scores
-        for question, answer in questionnaire_data.items():
-            scores[f'q_{question}'] = answer
+        scores.update((f'q_{question}', answer) for question, answer in questionnaire_data.items())
             
         return scores
     
     def _calculate_gaze_features(self, gaze_data):
         """Calculate gaze pattern features"""
-        if not gaze_data:
+        if gaze_data is None or len(gaze_data) == 0:
             return {}
-            
-        gaze_df = pd.DataFrame(gaze_data)
+        
+        columns = self._gaze_feature_columns(gaze_data)
         features = {}
         
-        # Basic gaze metrics
-        if 'fixation_duration' in gaze_df.columns:
-            features['avg_fixation_duration'] = gaze_df['fixation_duration'].mean()
-            features['std_fixation_duration'] = gaze_df['fixation_duration'].std()
-            features['total_fixation_time'] = gaze_df['fixation_duration'].sum()
-        
-        if 'saccade_amplitude' in gaze_df.columns:
-            features['avg_saccade_amplitude'] = gaze_df['saccade_amplitude'].mean()
-            features['std_saccade_amplitude'] = gaze_df['saccade_amplitude'].std()
-        
-        # Eye contact metrics
-        if 'eye_contact_duration' in gaze_df.columns:
-            features['total_eye_contact'] = gaze_df['eye_contact_duration'].sum()
-            features['avg_eye_contact'] = gaze_df['eye_contact_duration'].mean()
-            features['eye_contact_frequency'] = len(gaze_df[gaze_df['eye_contact_duration'] > 0])
-        
-        # Social attention metrics
-        if 'social_attention_score' in gaze_df.columns:
-            features['avg_social_attention'] = gaze_df['social_attention_score'].mean()
-            features['social_attention_variability'] = gaze_df['social_attention_score'].std()
-        
-        # Gaze pattern regularity
-        if 'gaze_x' in gaze_df.columns and 'gaze_y' in gaze_df.columns:
-            features['gaze_dispersion_x'] = gaze_df['gaze_x'].std()
-            features['gaze_dispersion_y'] = gaze_df['gaze_y'].std()
-            features['gaze_center_tendency'] = np.sqrt(gaze_df['gaze_x'].var() + gaze_df['gaze_y'].var())
+        with warnings.catch_warnings():
+            # A single sample has no sample std; pandas returned NaN there too
+            warnings.simplefilter("ignore", RuntimeWarning)
+            
+            # Basic gaze metrics
+            if 'fixation_duration' in columns:
+                values = columns['fixation_duration']
+                features['avg_fixation_duration'] = np.nanmean(values)
+                features['std_fixation_duration'] = np.nanstd(values, ddof=1)
+                features['total_fixation_time'] = np.nansum(values)
+            
+            if 'saccade_amplitude' in columns:
+                values = columns['saccade_amplitude']
+                features['avg_saccade_amplitude'] = np.nanmean(values)
+                features['std_saccade_amplitude'] = np.nanstd(values, ddof=1)
+            
+            # Eye contact metrics
+            if 'eye_contact_duration' in columns:
+                values = columns['eye_contact_duration']
+                features['total_eye_contact'] = np.nansum(values)
+                features['avg_eye_contact'] = np.nanmean(values)
+                features['eye_contact_frequency'] = int(np.count_nonzero(values > 0))
+            
+            # Social attention metrics
+            if 'social_attention_score' in columns:
+                values = columns['social_attention_score']
+                features['avg_social_attention'] = np.nanmean(values)
+                features['social_attention_variability'] = np.nanstd(values, ddof=1)
+            
+            # Gaze pattern regularity
+            if 'gaze_x' in columns and 'gaze_y' in columns:
+                var_x = np.nanvar(columns['gaze_x'], ddof=1)
+                var_y = np.nanvar(columns['gaze_y'], ddof=1)
+                features['gaze_dispersion_x'] = np.sqrt(var_x)
+                features['gaze_dispersion_y'] = np.sqrt(var_y)
+                features['gaze_center_tendency'] = np.sqrt(var_x + var_y)
         
         return features
     
+    def _gaze_feature_columns(self, gaze_data):
+        """Collect the gaze feature columns as float64 arrays (NaN where a sample lacks the key)"""
+        if isinstance(gaze_data, np.ndarray):
+            return {key: gaze_data[key].astype(np.float64)
+                    for key in GAZE_FEATURE_KEYS if key in gaze_data.dtype.names}
+        
+        present = [key for key in GAZE_FEATURE_KEYS if any(key in point for point in gaze_data)]
+        values = np.array([[point.get(key, np.nan) for key in present] for point in gaze_data], dtype=np.float64)
+        return {key: values[:, i] for i, key in enumerate(present)}
+    
     def create_synthetic_training_data(self, n_samples=1000):
         """Create synthetic training data based on ASD research patterns"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
-        # Generate synthetic behavioral data
-        data = []
-        labels = []
+        # Randomly assign ASD vs typical development
+        labels = rng.binomial(1, 0.3, n_samples)  # 30% ASD prevalence in synthetic data
+        is_asd = labels.astype(bool)
         
-        for i in range(n_samples):
-            # Randomly assign ASD vs typical development
-            is_asd = np.random.choice([0, 1], p=[0.7, 0.3])  # 30% ASD prevalence in synthetic data
-            
-            sample = {}
-            
-            # Behavioral features based on research findings
-            if is_asd:
-                # ASD patterns
-                sample['social_communication_score'] = np.random.normal(15, 5)  # Lower social communication
-                sample['autism_traits_score'] = np.random.normal(25, 6)  # Higher autism traits
-                sample['avg_fixation_duration'] = np.random.normal(800, 200)  # Longer fixations
-                sample['total_eye_contact'] = np.random.normal(20, 10)  # Less eye contact
-                sample['avg_social_attention'] = np.random.normal(0.3, 0.1)  # Lower social attention
-                sample['gaze_dispersion_x'] = np.random.normal(100, 30)  # More dispersed gaze
-                sample['gaze_dispersion_y'] = np.random.normal(100, 30)
-            else:
-                # Typical development patterns
-                sample['social_communication_score'] = np.random.normal(25, 4)  # Higher social communication
-                sample['autism_traits_score'] = np.random.normal(12, 4)  # Lower autism traits
-                sample['avg_fixation_duration'] = np.random.normal(600, 150)  # Shorter fixations
-                sample['total_eye_contact'] = np.random.normal(60, 15)  # More eye contact
-                sample['avg_social_attention'] = np.random.normal(0.7, 0.1)  # Higher social attention
-                sample['gaze_dispersion_x'] = np.random.normal(60, 20)  # More focused gaze
-                sample['gaze_dispersion_y'] = np.random.normal(60, 20)
-            
-            # Add some noise and individual variation
-            for key in sample:
-                if sample[key] > 0:
-                    sample[key] += np.random.normal(0, abs(sample[key]) * 0.1)  # 10% noise
-                
-            data.append(sample)
-            labels.append(is_asd)
-        
-        return pd.DataFrame(data), np.array(labels)
+        # Behavioral features based on research findings: (ASD mean, std), (typical mean, std)
+        features = list(SYNTHETIC_FEATURE_DISTRIBUTIONS)
+        params = np.array(list(SYNTHETIC_FEATURE_DISTRIBUTIONS.values()))  # (feature, group, mean/std)
+        means = np.where(is_asd[:, None], params[:, 0, 0], params[:, 1, 0])
+        stds = np.where(is_asd[:, None], params[:, 0, 1], params[:, 1, 1])
+        X = rng.standard_normal((n_samples, len(features)))
+        X *= stds
+        X += means
+        
+        # Add some noise and individual variation (10% of each positive value), in place
+        np.multiply(X, 1 + rng.normal(0, 0.1, X.shape), out=X, where=X > 0)
+        
+        return pd.DataFrame(X, columns=features), labels
     
     def train_models(self):
         """Train the ensemble of models"""
@@ -156,9 +182,10 @@ class BehavioralModel:
         
         # Store feature names
         self.feature_names = X_df.columns.tolist()
+        self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
         
         # Convert to numpy array and scale
-        X = self.scaler.fit_transform(X_df)
+        X = self.scaler.fit_transform(X_df.to_numpy())
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -179,39 +206,69 @@ class BehavioralModel:
         self.is_trained = True
         return self.model_performance
     
+    def save(self, path=MODEL_CACHE):
+        """Persist the fitted ensemble so later processes can skip training"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        joblib.dump({
+            'models': self.models,
+            'scaler': self.scaler,
+            'feature_names': self.feature_names,
+            'model_performance': self.model_performance
+        }, path)
+    
+    def load(self, path=MODEL_CACHE):
+        """Load a previously saved ensemble; returns False if there is no usable cache"""
+        try:
+            cached = joblib.load(path, mmap_mode='r')
+        except Exception:
+            return False
+        # Ignore caches written for a different set of models
+        if set(cached.get('models', {})) != set(self.models):
+            return False
+        self.models = cached['models']
+        self.scaler = cached['scaler']
+        self.feature_names = cached['feature_names']
+        self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        self.model_performance = cached.get('model_performance', {})
+        self.is_trained = True
+        return True
+    
+    def ensure_trained(self):
+        """Load the cached ensemble, training and caching it on first use"""
+        if self.is_trained or self.load():
+            return
+        self.train_models()
+        try:
+            self.save()
+        except OSError:
+            pass  # read-only deploys just retrain per process
+    
     def predict(self, features_dict):
         """Make prediction using ensemble of models"""
-        if not self.is_trained:
-            self.train_models()
-        
-        # Prepare feature vector
-        feature_vector = []
-        for feature_name in self.feature_names:
-            feature_vector.append(features_dict.get(feature_name, 0))
-        
-        feature_vector = np.array(feature_vector).reshape(1, -1)
+        self.ensure_trained()
+        
+        # Prepare feature vector; features the model wasn't trained on are ignored
+        feature_vector = np.zeros((1, len(self.feature_names)))
+        for feature_name, value in features_dict.items():
+            i = self._feature_index.get(feature_name)
+            if i is not None:
+                feature_vector[0, i] = value
         feature_vector = self.scaler.transform(feature_vector)
         
-        # Get predictions from all models
-        predictions = {}
-        probabilities = {}
+        # One predict_proba per model; hard labels are derived from it
+        names = list(self.models)
+        probs = np.stack([self.models[name].predict_proba(feature_vector)[0] for name in names])
+        preds = (probs[:, 1] >= 0.5).astype(int)
+        avg_prob_typical, avg_prob_asd = probs.mean(axis=0)
         
-        for name, model in self.models.items():
-            pred = model.predict(feature_vector)[0]
-            prob = model.predict_proba(feature_vector)[0]
-            
-            predictions[name] = pred
-            probabilities[name] = {
-                'typical': prob[0],
-                'asd_indicators': prob[1]
-            }
-        
-        # Ensemble prediction (majority vote)
-        ensemble_pred = max(set(predictions.values()), key=list(predictions.values()).count)
+        predictions = dict(zip(names, preds.tolist()))
+        probabilities = {
+            name: {'typical': prob[0], 'asd_indicators': prob[1]}
+            for name, prob in zip(names, probs.tolist())
+        }
         
-        # Average probabilities
-        avg_prob_typical = np.mean([prob['typical'] for prob in probabilities.values()])
-        avg_prob_asd = np.mean([prob['asd_indicators'] for prob in probabilities.values()])
+        # Ensemble prediction (soft vote; a two-model majority vote could tie)
+        ensemble_pred = int(avg_prob_asd >= 0.5)
         
         return {
             'prediction': ensemble_pred,
@@ -224,8 +281,7 @@ class BehavioralModel:
     
     def get_feature_importance(self):
         """Get feature importance from Random Forest model"""
-        if not self.is_trained:
-            self.train_models()
+        self.ensure_trained()
         
         rf_model = self.models['random_forest']
         importance_scores = rf_model.feature_importances_
@@ -238,3 +294,10 @@ class BehavioralModel:
         sorted_features = sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)
         
         return sorted_features
+
+if __name__ == "__main__":
+    # python -m models.behavioral_model  -> retrain and refresh the cached ensemble
+    model = BehavioralModel()
+    performance = model.train_models()
+    model.save()
+    print(json.dumps(performance, indent=2))
@@ -4,45 +4,187 @@ import numpy as np
 from collections import deque
 import time
 import math
+import os
+
+# Minimum seconds between MediaPipe runs (~15 Hz); frames in between track the last landmarks
+DETECTION_INTERVAL = 0.066
+
+# Frames wider than this are downscaled before FaceMesh (landmarks come back normalized)
+DETECTION_WIDTH = 320
+
+# Optional MediaPipe Tasks face_landmarker.task model; when set it replaces the legacy
+# CPU-only FaceMesh solution and runs on FACE_LANDMARKER_DELEGATE (GPU or CPU)
+FACE_LANDMARKER_MODEL = os.getenv("FACE_LANDMARKER_MODEL")
+FACE_LANDMARKER_DELEGATE = os.getenv("FACE_LANDMARKER_DELEGATE", "GPU").upper()
+
+# Mean Lucas-Kanade error above which optical-flow tracking gives up and FaceMesh reruns
+TRACKING_MAX_ERROR = 12.0
+
+# Packed per-frame gaze record; field names match the gaze_data columns
+GAZE_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('face_detected', '?'),
+    ('gaze_x', 'f4'),
+    ('gaze_y', 'f4'),
+    ('eye_contact_score', 'f4'),
+    ('fixation_duration', 'f4'),
+    ('saccade_amplitude', 'f4'),
+    ('social_attention_score', 'f4'),
+])
+
+# MediaPipe FaceMesh landmark indices (iris points require refine_landmarks=True)
+LEFT_EYE_INDICES = np.array([33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246], dtype=np.int32)
+RIGHT_EYE_INDICES = np.array([362, 382, 381, 380, 374, 373, 390, 249, 263, 466, 388, 387, 386, 385, 384, 398], dtype=np.int32)
+LEFT_IRIS_INDICES = np.array([474, 475, 476, 477], dtype=np.int32)
+RIGHT_IRIS_INDICES = np.array([469, 470, 471, 472], dtype=np.int32)
+
+# Landmarks the gaze math reads; only these are extracted from the model output and
+# tracked between runs, stored as rows of one (40, 2) buffer in this order
+TRACKED_INDICES = np.concatenate([LEFT_EYE_INDICES, RIGHT_EYE_INDICES, LEFT_IRIS_INDICES, RIGHT_IRIS_INDICES])
+_eye_ends = np.cumsum([len(LEFT_EYE_INDICES), len(RIGHT_EYE_INDICES), len(LEFT_IRIS_INDICES), len(RIGHT_IRIS_INDICES)]).tolist()
+LEFT_EYE_ROWS = slice(0, _eye_ends[0])
+RIGHT_EYE_ROWS = slice(_eye_ends[0], _eye_ends[1])
+LEFT_IRIS_ROWS = slice(_eye_ends[1], _eye_ends[2])
+RIGHT_IRIS_ROWS = slice(_eye_ends[2], _eye_ends[3])
+
+# Number of recent gaze points kept for fixation/saccade/summary statistics
+GAZE_HISTORY_SIZE = 100
+
+# Eye contact scores above this count as eye contact
+EYE_CONTACT_THRESHOLD = 0.3
+
+# Longest gap (seconds) credited to one sample; longer gaps are frames without a face
+MAX_SAMPLE_INTERVAL = 0.5
+
+class GazeRingBuffer:
+    """Fixed-size history of (x, y, eye contact) samples and their timestamps with O(1) append and summary"""
+    
+    def __init__(self, capacity=GAZE_HISTORY_SIZE, eye_contact_threshold=EYE_CONTACT_THRESHOLD):
+        self.capacity = capacity
+        self.eye_contact_threshold = eye_contact_threshold
+        # Each sample is written twice, capacity apart, so the last `capacity`
+        # samples are always one contiguous slice (no reordering copy)
+        self._buf = np.empty((2 * capacity, 3), dtype=np.float32)
+        # Epoch seconds need double precision, so timestamps live in their own array
+        self._ts = np.empty(2 * capacity, dtype=np.float64)
+        # Time from each sample to the next one, used for eye contact time
+        self._interval = np.zeros(capacity, dtype=np.float64)
+        self.clear()
+    
+    def __len__(self):
+        return min(self._count, self.capacity)
+    
+    def append(self, point, eye_contact_score, timestamp):
+        head = self._count % self.capacity
+        if self._count:
+            # The previous sample lasted until this one
+            prev = (self._count - 1) % self.capacity
+            interval = min(timestamp - self._ts[prev], MAX_SAMPLE_INTERVAL)
+            self._interval[prev] = interval
+            if self._buf[prev, 2] > self.eye_contact_threshold:
+                self.eye_contact_time += interval
+        if self._count >= self.capacity:
+            self._accumulate(*self._buf[head].tolist(), sign=-1)  # evicted sample
+            if self._buf[head, 2] > self.eye_contact_threshold:
+                self.eye_contact_time -= self._interval[head]
+        self._buf[head] = (point[0], point[1], eye_contact_score)
+        self._buf[head + self.capacity] = self._buf[head]
+        self._ts[head] = self._ts[head + self.capacity] = timestamp
+        self._accumulate(*self._buf[head].tolist(), sign=1)
+        self._count += 1
+    
+    def _accumulate(self, x, y, eye_contact, sign):
+        self.sum_x += sign * x
+        self.sum_y += sign * y
+        self.sum_x2 += sign * x * x
+        self.sum_y2 += sign * y * y
+        self.eye_contact_sum += sign * eye_contact
+        if eye_contact > self.eye_contact_threshold:
+            self.eye_contact_count += sign
+    
+    def clear(self):
+        self._count = 0
+        self.sum_x = self.sum_y = self.sum_x2 = self.sum_y2 = 0.0
+        self.eye_contact_sum = 0.0
+        self.eye_contact_count = 0
+        self.eye_contact_time = 0.0
+    
+    def window(self):
+        """View of the stored (x, y) points, oldest first"""
+        if self._count <= self.capacity:
+            return self._buf[:self._count, :2]
+        start = self._count % self.capacity
+        return self._buf[start:start + self.capacity, :2]
+    
+    def times(self):
+        """View of the stored timestamps, aligned with window()"""
+        if self._count <= self.capacity:
+            return self._ts[:self._count]
+        start = self._count % self.capacity
+        return self._ts[start:start + self.capacity]
+    
+    def summary(self):
+        """Mean/std of x and y plus eye contact stats from the running sums"""
+        n = len(self)
+        mean_x, mean_y = self.sum_x / n, self.sum_y / n
+        return {
+            'mean_x': mean_x,
+            'mean_y': mean_y,
+            # max() guards against tiny negative variances from float cancellation
+            'std_x': math.sqrt(max(self.sum_x2 / n - mean_x * mean_x, 0.0)),
+            'std_y': math.sqrt(max(self.sum_y2 / n - mean_y * mean_y, 0.0)),
+            'eye_contact_mean': self.eye_contact_sum / n,
+            'eye_contact_count': self.eye_contact_count,
+            'eye_contact_time': max(self.eye_contact_time, 0.0),
+        }
 
 class GazeAnalyzer:
     def __init__(self):
-        # Initialize MediaPipe Face Mesh
-        self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        
-        # Eye landmarks indices
-        self.LEFT_EYE_INDICES = [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246]
-        self.RIGHT_EYE_INDICES = [362, 382, 381, 380, 374, 373, 390, 249, 263, 466, 388, 387, 386, 385, 384, 398]
-        
-        # Iris landmarks
-        self.LEFT_IRIS_INDICES = [474, 475, 476, 477]
-        self.RIGHT_IRIS_INDICES = [469, 470, 471, 472]
+        # Initialize MediaPipe Face Mesh (or the Tasks face landmarker when a model is configured)
+        self.face_landmarker = None
+        self._landmarker_ts_ms = 0
+        if FACE_LANDMARKER_MODEL:
+            self.face_landmarker = self._create_face_landmarker(FACE_LANDMARKER_MODEL)
+            self.face_mesh = None
+        else:
+            self.mp_face_mesh = mp.solutions.face_mesh
+            self.face_mesh = self.mp_face_mesh.FaceMesh(
+                static_image_mode=False,  # track landmarks between frames instead of re-detecting
+                max_num_faces=1,
+                refine_landmarks=True,  # iris landmarks 468+ are needed for gaze direction
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
         
         # Data storage
-        self.gaze_history = deque(maxlen=100)
+        self.gaze_history = GazeRingBuffer()  # gaze points plus their eye contact scores
         self.fixation_history = deque(maxlen=50)
-        self.eye_contact_history = deque(maxlen=100)
         
         # Calibration data
         self.is_calibrated = False
         self.calibration_points = []
         self.gaze_offset = [0, 0]
+        self.calibration_affine = None  # ((a, b), (c, d), (e, f)): x' = a*x + c*y + e, y' = b*x + d*y + f
         
         # Analysis parameters
         self.fixation_threshold = 50  # pixels
         self.fixation_duration_threshold = 100  # milliseconds
-        self.eye_contact_threshold = 0.3  # normalized distance threshold
+        self.eye_contact_threshold = EYE_CONTACT_THRESHOLD  # normalized distance threshold
+        
+        # Detection caching
+        self.detection_interval = DETECTION_INTERVAL
+        self._last_landmarks = None
+        self._last_detect_ts = float('-inf')
+        self._last_gray = None
+        self._landmark_buf = np.empty((len(TRACKED_INDICES), 2), dtype=np.float32)
+        
+        # Preallocated per-frame image buffers, resized when the frame size changes
+        self._small_buf = None
+        self._rgb_buf = None
         
     def process_frame(self, frame):
         """Process a single frame and extract gaze data"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
+        landmarks = self._detect_landmarks(frame)
         
         gaze_data = {
             'timestamp': time.time(),
@@ -55,17 +197,16 @@ class GazeAnalyzer:
             'social_attention_score': 0
         }
         
-        if results.multi_face_landmarks:
-            face_landmarks = results.multi_face_landmarks[0]
+        if landmarks is not None:
             gaze_data['face_detected'] = True
             
             # Extract eye regions
-            left_eye_landmarks = self._get_eye_landmarks(face_landmarks, self.LEFT_EYE_INDICES)
-            right_eye_landmarks = self._get_eye_landmarks(face_landmarks, self.RIGHT_EYE_INDICES)
+            left_eye_landmarks = landmarks[LEFT_EYE_ROWS]
+            right_eye_landmarks = landmarks[RIGHT_EYE_ROWS]
             
             # Extract iris positions
-            left_iris = self._get_iris_landmarks(face_landmarks, self.LEFT_IRIS_INDICES)
-            right_iris = self._get_iris_landmarks(face_landmarks, self.RIGHT_IRIS_INDICES)
+            left_iris = landmarks[LEFT_IRIS_ROWS]
+            right_iris = landmarks[RIGHT_IRIS_ROWS]
             
             # Calculate gaze direction
             gaze_point = self._calculate_gaze_direction(
@@ -80,8 +221,8 @@ class GazeAnalyzer:
             # Calculate eye contact score
             gaze_data['eye_contact_score'] = self._calculate_eye_contact_score(gaze_point, frame.shape)
             
-            # Update gaze history
-            self.gaze_history.append(gaze_point)
+            # Update gaze and eye contact history
+            self.gaze_history.append(gaze_point, gaze_data['eye_contact_score'], gaze_data['timestamp'])
             
             # Calculate fixation duration
             gaze_data['fixation_duration'] = self._calculate_fixation_duration()
@@ -90,55 +231,127 @@ class GazeAnalyzer:
             gaze_data['saccade_amplitude'] = self._calculate_saccade_amplitude()
             
             # Calculate social attention score
-            gaze_data['social_attention_score'] = self._calculate_social_attention_score(gaze_point, frame.shape)
-            
-            # Store eye contact history
-            self.eye_contact_history.append(gaze_data['eye_contact_score'])
+            gaze_data['social_attention_score'] = self._calculate_social_attention_score(
+                gaze_point, frame.shape, gaze_data['eye_contact_score'])
         
         return gaze_data
     
-    def _get_eye_landmarks(self, face_landmarks, eye_indices):
-        """Extract eye landmark coordinates"""
-        eye_points = []
-        for idx in eye_indices:
-            landmark = face_landmarks.landmark[idx]
-            eye_points.append([landmark.x, landmark.y])
-        return np.array(eye_points)
+    def _detect_landmarks(self, frame):
+        """Run MediaPipe at most once per detection interval, tracking landmarks with optical flow otherwise.
+        
+        Returns the (40, 2) float32 buffer of normalized x/y for TRACKED_INDICES, or None
+        if no face. The buffer is overwritten on the next call.
+        """
+        h, w = frame.shape[:2]
+        if w > DETECTION_WIDTH:
+            small_h = int(h * DETECTION_WIDTH / w)
+            if self._small_buf is None or self._small_buf.shape != (small_h, DETECTION_WIDTH, 3):
+                self._small_buf = np.empty((small_h, DETECTION_WIDTH, 3), dtype=np.uint8)
+            small = cv2.resize(frame, (DETECTION_WIDTH, small_h), dst=self._small_buf,
+                               interpolation=cv2.INTER_AREA)
+        else:
+            small = frame
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        
+        now = time.monotonic()
+        if now - self._last_detect_ts < self.detection_interval:
+            if self._last_landmarks is None or self._track_landmarks(gray):
+                self._last_gray = gray
+                return self._last_landmarks
+            # Tracking lost the eyes; fall through to a fresh detection
+        
+        if small is not frame:
+            # The resized copy is ours, so convert it in place
+            rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=small)
+        else:
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # Read-only input lets MediaPipe use the buffer without a defensive copy
+        rgb_frame.flags.writeable = False
+        points = self._run_landmark_model(rgb_frame)
+        rgb_frame.flags.writeable = True  # the buffer is reused for the next frame
+        
+        self._last_detect_ts = now
+        self._last_gray = gray
+        if points is not None:
+            # Read only the 40 landmarks the gaze math uses into the preallocated buffer
+            self._landmark_buf[:] = [(points[i].x, points[i].y) for i in TRACKED_INDICES.tolist()]
+            self._last_landmarks = self._landmark_buf
+        else:
+            self._last_landmarks = None
+        return self._last_landmarks
+    
+    def _create_face_landmarker(self, model_path):
+        """Build a Tasks FaceLandmarker on the configured delegate, falling back to CPU"""
+        from mediapipe.tasks.python import BaseOptions, vision
+        
+        def options(delegate):
+            return vision.FaceLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=model_path, delegate=delegate),
+                running_mode=vision.RunningMode.VIDEO,
+                num_faces=1,
+                min_face_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+                output_face_blendshapes=False,
+            )
+        
+        delegate = getattr(BaseOptions.Delegate, FACE_LANDMARKER_DELEGATE, BaseOptions.Delegate.CPU)
+        try:
+            return vision.FaceLandmarker.create_from_options(options(delegate))
+        except RuntimeError:
+            # No usable GPU/GL context on this host
+            return vision.FaceLandmarker.create_from_options(options(BaseOptions.Delegate.CPU))
     
-    def _get_iris_landmarks(self, face_landmarks, iris_indices):
-        """Extract iris landmark coordinates"""
-        iris_points = []
-        for idx in iris_indices:
-            landmark = face_landmarks.landmark[idx]
-            iris_points.append([landmark.x, landmark.y])
-        return np.array(iris_points)
+    def _run_landmark_model(self, rgb_frame):
+        """Run the landmark model on an RGB frame; returns the face's landmark list or None"""
+        if self.face_landmarker is not None:
+            # VIDEO mode requires strictly increasing timestamps
+            self._landmarker_ts_ms = max(self._landmarker_ts_ms + 1, int(time.monotonic() * 1000))
+            result = self.face_landmarker.detect_for_video(
+                mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame), self._landmarker_ts_ms
+            )
+            return result.face_landmarks[0] if result.face_landmarks else None
+        
+        results = self.face_mesh.process(rgb_frame)
+        return results.multi_face_landmarks[0].landmark if results.multi_face_landmarks else None
+    
+    def _track_landmarks(self, gray):
+        """Move the cached eye/iris landmarks to the new frame with Lucas-Kanade optical flow"""
+        if self._last_gray is None or self._last_gray.shape != gray.shape:
+            return False
+        
+        h, w = gray.shape
+        scale = np.array([w, h], dtype=np.float32)
+        prev_points = (self._last_landmarks * scale).reshape(-1, 1, 2)
+        next_points, status, error = cv2.calcOpticalFlowPyrLK(
+            self._last_gray, gray, prev_points, None, winSize=(15, 15), maxLevel=2
+        )
+        if next_points is None or not status.all() or error.mean() > TRACKING_MAX_ERROR:
+            return False
+        
+        np.divide(next_points.reshape(-1, 2), scale, out=self._last_landmarks)
+        return True
     
     def _calculate_gaze_direction(self, left_eye, right_eye, left_iris, right_iris, frame_shape):
         """Calculate gaze direction from eye and iris positions"""
         h, w = frame_shape[:2]
         
-        # Calculate eye centers
-        left_eye_center = np.mean(left_eye, axis=0)
-        right_eye_center = np.mean(right_eye, axis=0)
-        
-        # Calculate iris centers
-        left_iris_center = np.mean(left_iris, axis=0)
-        right_iris_center = np.mean(right_iris, axis=0)
+        # Gaze vector (iris center relative to eye center), averaged over both eyes
+        avg_gaze_x, avg_gaze_y = (left_iris.mean(axis=0) + right_iris.mean(axis=0)
+                                  - left_eye.mean(axis=0) - right_eye.mean(axis=0)) / 2
         
-        # Calculate gaze vectors (iris relative to eye center)
-        left_gaze_vector = left_iris_center - left_eye_center
-        right_gaze_vector = right_iris_center - right_eye_center
+        # Convert to screen coordinates (plain floats keep the scoring math off NumPy scalars)
+        gaze_x = float(avg_gaze_x) * w
+        gaze_y = float(avg_gaze_y) * h
         
-        # Average the gaze vectors
-        avg_gaze_vector = (left_gaze_vector + right_gaze_vector) / 2
-        
-        # Convert to screen coordinates
-        gaze_x = avg_gaze_vector[0] * w
-        gaze_y = avg_gaze_vector[1] * h
-        
-        # Apply calibration offset if available
-        gaze_x += self.gaze_offset[0]
-        gaze_y += self.gaze_offset[1]
+        # Apply calibration: affine fit if available, otherwise the plain offset
+        if self.calibration_affine is not None:
+            (a, b), (c, d), (e, f) = self.calibration_affine
+            gaze_x, gaze_y = a * gaze_x + c * gaze_y + e, b * gaze_x + d * gaze_y + f
+        else:
+            gaze_x += self.gaze_offset[0]
+            gaze_y += self.gaze_offset[1]
         
         return [gaze_x, gaze_y]
     
@@ -151,18 +364,18 @@ class GazeAnalyzer:
         eye_contact_region_width = w * 0.2  # 20% of screen width
         eye_contact_region_height = h * 0.2  # 20% of screen height
         
-        # Calculate distance from gaze point to center
-        distance = math.sqrt(
-            (gaze_point[0] - center_x) ** 2 + 
-            (gaze_point[1] - center_y) ** 2
-        )
+        # Squared distance from gaze point to center, normalized by the squared region diagonal
+        dx = gaze_point[0] - center_x
+        dy = gaze_point[1] - center_y
+        max_distance_sq = eye_contact_region_width ** 2 + eye_contact_region_height ** 2
+        normalized_distance_sq = (dx * dx + dy * dy) / max_distance_sq
         
-        # Normalize distance
-        max_distance = math.sqrt(eye_contact_region_width ** 2 + eye_contact_region_height ** 2)
-        normalized_distance = min(distance / max_distance, 1.0)
+        # Gaze outside the region scores 0 without needing a sqrt
+        if normalized_distance_sq >= 1.0:
+            return 0.0
         
         # Convert to eye contact score (closer to center = higher score)
-        eye_contact_score = max(0, 1.0 - normalized_distance)
+        eye_contact_score = 1.0 - math.sqrt(normalized_distance_sq)
         
         return eye_contact_score
     
@@ -171,32 +384,27 @@ class GazeAnalyzer:
         if len(self.gaze_history) < 2:
             return 0
         
-        current_point = self.gaze_history[-1]
-        fixation_start_time = time.time()
-        fixation_duration = 0
+        points = self.gaze_history.window()
         
-        # Look backwards through gaze history to find fixation start
-        for i in range(len(self.gaze_history) - 2, -1, -1):
-            prev_point = self.gaze_history[i]
-            distance = math.sqrt(
-                (current_point[0] - prev_point[0]) ** 2 + 
-                (current_point[1] - prev_point[1]) ** 2
-            )
-            
-            if distance > self.fixation_threshold:
-                break
-            
-            fixation_duration += 33  # Assuming ~30 FPS (33ms per frame)
+        # Squared distance from each earlier sample to the current point, newest first
+        offsets = points[-2::-1] - points[-1]
+        distances_sq = np.einsum('ij,ij->i', offsets, offsets)
         
-        return fixation_duration
+        # Fixation start is the first sample (looking backwards) outside the threshold
+        outside = distances_sq > self.fixation_threshold ** 2
+        fixation_frames = np.argmax(outside) if outside.any() else len(distances_sq)
+        
+        # Measured from sample timestamps (the stream is frame-capped and the worker drops
+        # frames), with each gap capped like eye contact time so face-loss isn't fixation
+        intervals = np.diff(self.gaze_history.times()[-1 - fixation_frames:])
+        return np.minimum(intervals, MAX_SAMPLE_INTERVAL).sum() * 1000
     
     def _calculate_saccade_amplitude(self):
         """Calculate amplitude of the last saccade"""
         if len(self.gaze_history) < 2:
             return 0
         
-        current_point = self.gaze_history[-1]
-        prev_point = self.gaze_history[-2]
+        prev_point, current_point = self.gaze_history.window()[-2:]
         
         amplitude = math.sqrt(
             (current_point[0] - prev_point[0]) ** 2 + 
@@ -205,8 +413,8 @@ class GazeAnalyzer:
         
         return amplitude
     
-    def _calculate_social_attention_score(self, gaze_point, frame_shape):
-        """Calculate social attention score based on gaze patterns"""
+    def _calculate_social_attention_score(self, gaze_point, frame_shape, eye_contact_score=None):
+        """Calculate social attention score based on gaze patterns (reuses eye_contact_score if given)"""
         h, w = frame_shape[:2]
         
         # Define social regions (upper half of screen where faces typically appear)
@@ -220,7 +428,8 @@ class GazeAnalyzer:
             social_attention_score += 0.5
         
         # Check for eye contact
-        eye_contact_score = self._calculate_eye_contact_score(gaze_point, frame_shape)
+        if eye_contact_score is None:
+            eye_contact_score = self._calculate_eye_contact_score(gaze_point, frame_shape)
         social_attention_score += eye_contact_score * 0.5
         
         return min(social_attention_score, 1.0)
@@ -230,46 +439,47 @@ class GazeAnalyzer:
         if len(self.gaze_history) == 0:
             return {}
         
-        gaze_points = list(self.gaze_history)
-        eye_contact_scores = list(self.eye_contact_history)
+        stats = self.gaze_history.summary()
         
         summary = {
-            'total_samples': len(gaze_points),
-            'avg_gaze_x': np.mean([p[0] for p in gaze_points]),
-            'avg_gaze_y': np.mean([p[1] for p in gaze_points]),
-            'gaze_dispersion_x': np.std([p[0] for p in gaze_points]),
-            'gaze_dispersion_y': np.std([p[1] for p in gaze_points]),
+            'total_samples': len(self.gaze_history),
+            'avg_gaze_x': stats['mean_x'],
+            'avg_gaze_y': stats['mean_y'],
+            'gaze_dispersion_x': stats['std_x'],
+            'gaze_dispersion_y': stats['std_y'],
+            'avg_eye_contact_score': stats['eye_contact_mean'],
+            'total_eye_contact_time': stats['eye_contact_time'] * 1000,  # ms
+            'eye_contact_frequency': stats['eye_contact_count'] / len(self.gaze_history)
         }
         
-        if eye_contact_scores:
-            summary.update({
-                'avg_eye_contact_score': np.mean(eye_contact_scores),
-                'total_eye_contact_time': sum([1 for score in eye_contact_scores if score > self.eye_contact_threshold]) * 33,  # ms
-                'eye_contact_frequency': len([score for score in eye_contact_scores if score > self.eye_contact_threshold]) / len(eye_contact_scores)
-            })
-        
         return summary
     
     def reset_data(self):
         """Reset all gaze tracking data"""
         self.gaze_history.clear()
         self.fixation_history.clear()
-        self.eye_contact_history.clear()
         self.is_calibrated = False
         self.calibration_points = []
         self.gaze_offset = [0, 0]
+        self.calibration_affine = None
+        self._last_landmarks = None
+        self._last_detect_ts = float('-inf')
+        self._last_gray = None
     
     def calibrate(self, calibration_data):
         """Calibrate gaze tracking using calibration points"""
         if len(calibration_data) >= 4:  # Need at least 4 points for calibration
-            # Simple offset calibration
-            actual_points = [point['actual'] for point in calibration_data]
-            measured_points = [point['measured'] for point in calibration_data]
+            actual = np.array([point['actual'] for point in calibration_data], dtype=np.float64)
+            measured = np.array([point['measured'] for point in calibration_data], dtype=np.float64)
             
-            avg_offset_x = np.mean([a[0] - m[0] for a, m in zip(actual_points, measured_points)])
-            avg_offset_y = np.mean([a[1] - m[1] for a, m in zip(actual_points, measured_points)])
+            # Offset calibration, kept as the fallback
+            self.gaze_offset = (actual - measured).mean(axis=0).tolist()
             
-            self.gaze_offset = [avg_offset_x, avg_offset_y]
+            # Least-squares affine fit also corrects scale and rotation; skipped when the
+            # measured points are collinear and the fit is underdetermined
+            design = np.column_stack([measured, np.ones(len(measured))])
+            affine, _, rank, _ = np.linalg.lstsq(design, actual, rcond=None)
+            self.calibration_affine = tuple(map(tuple, affine.tolist())) if rank == 3 else None
             self.is_calibrated = True
             
             return True
@@ -2,8 +2,25 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
+import io
 from datetime import datetime, timedelta
-from database.models import db_manager
+from sqlalchemy import case, func, select
+from database.models import get_db_manager
+
+# Raw SQL interface limits
+SQL_QUERY_ROW_LIMIT = 1000
+SQL_QUERY_TIMEOUT_MS = 30000
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_cached_statistics():
+    """Assessment statistics, refreshed at most every 30 seconds"""
+    return get_db_manager().get_assessment_statistics()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_table_counts():
+    """Per-table row counts, refreshed at most every 60 seconds"""
+    return get_db_manager().get_table_counts()
 
 def show_admin_dashboard():
     st.header("📊 Admin Dashboard")
@@ -58,7 +75,7 @@ def show_overview_stats():
     st.subheader("System Overview")
     
     try:
-        stats = db_manager.get_assessment_statistics()
+        stats = get_cached_statistics()
         
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -95,41 +112,49 @@ def show_user_management():
     st.subheader("User Management")
     
     try:
-        db = db_manager.get_session()
+        db = get_db_manager().get_session()
         
-        # Get recent users
+        # Get recent users with their assessment counts in one grouped query
         from database.models import User, Assessment
-        users = db.query(User).order_by(User.created_at.desc()).limit(50).all()
+        rows = (
+            db.query(
+                User,
+                func.count(Assessment.id),
+                func.count(case((Assessment.status == "completed", 1)))
+            )
+            .outerjoin(Assessment, Assessment.user_id == User.id)
+            .group_by(User.id)
+            .order_by(User.created_at.desc())
+            .limit(50)
+            .all()
+        )
         
-        if users:
+        if rows:
             user_data = []
-            for user in users:
-                assessments = db.query(Assessment).filter(Assessment.user_id == user.id).all()
+            for user, assessment_count, completed_count in rows:
                 user_data.append({
                     "ID": user.id,
                     "Session ID": user.session_id[:8] + "...",
                     "Created": user.created_at.strftime("%Y-%m-%d %H:%M"),
                     "Age Group": user.age_group or "Not specified",
                     "Consent": "✅" if user.consent_given else "❌",
-                    "Assessments": len(assessments),
-                    "Completed": len([a for a in assessments if a.status == "completed"])
+                    "Assessments": assessment_count,
+                    "Completed": completed_count
                 })
             
             df = pd.DataFrame(user_data)
             st.dataframe(df, use_container_width=True)
             
-            # User activity over time
+            # User activity over time, bucketed by the database
             st.subheader("User Registration Timeline")
-            daily_users = {}
-            for user in users:
-                date = user.created_at.date()
-                daily_users[date] = daily_users.get(date, 0) + 1
+            day = func.date(User.created_at).label("day")
+            daily_df = pd.DataFrame(
+                db.query(day, func.count(User.id)).group_by(day).order_by(day).all(),
+                columns=["day", "n"]
+            )
             
-            if daily_users:
-                dates = list(daily_users.keys())
-                counts = list(daily_users.values())
-                
-                fig = px.line(x=dates, y=counts, title="Daily User Registrations")
+            if not daily_df.empty:
+                fig = px.line(daily_df, x="day", y="n", title="Daily User Registrations")
                 fig.update_xaxes(title="Date")
                 fig.update_yaxes(title="New Users")
                 st.plotly_chart(fig, use_container_width=True)
@@ -146,7 +171,7 @@ def show_assessment_management():
     st.subheader("Assessment Management")
     
     try:
-        db = db_manager.get_session()
+        db = get_db_manager().get_session()
         
         from database.models import Assessment, AssessmentResult, QuestionnaireResponse
         
@@ -154,11 +179,16 @@ def show_assessment_management():
         assessments = db.query(Assessment).order_by(Assessment.started_at.desc()).limit(20).all()
         
         if assessments:
+            # Load results for the whole page in one IN query instead of one per assessment
+            results_by_assessment = {}
+            for result in db.query(AssessmentResult).filter(
+                AssessmentResult.assessment_id.in_([a.id for a in assessments])
+            ).order_by(AssessmentResult.id):
+                results_by_assessment.setdefault(result.assessment_id, result)
+            
             assessment_data = []
             for assessment in assessments:
-                result = db.query(AssessmentResult).filter(
-                    AssessmentResult.assessment_id == assessment.id
-                ).first()
+                result = results_by_assessment.get(assessment.id)
                 
                 assessment_data.append({
                     "ID": assessment.id,
@@ -177,14 +207,14 @@ def show_assessment_management():
             # Assessment completion funnel
             st.subheader("Assessment Completion Funnel")
             
-            status_counts = {}
-            for assessment in assessments:
-                status_counts[assessment.status] = status_counts.get(assessment.status, 0) + 1
+            status_df = pd.DataFrame(
+                db.query(Assessment.status, func.count(Assessment.id)).group_by(Assessment.status).all(),
+                columns=["status", "n"]
+            )
             
-            if status_counts:
+            if not status_df.empty:
                 fig = px.funnel(
-                    y=list(status_counts.keys()),
-                    x=list(status_counts.values()),
+                    status_df, y="status", x="n",
                     title="Assessment Status Distribution"
                 )
                 st.plotly_chart(fig, use_container_width=True)
@@ -197,64 +227,100 @@ def show_assessment_management():
     except Exception as e:
         st.error(f"Error loading assessment data: {e}")
 
+@st.cache_data(show_spinner=False)
+def get_question_catalog():
+    """Map question id -> (domain, weight, critical item) from the questionnaire definition"""
+    from pages.questionnaire import load_questions
+    catalog = {}
+    for section in load_questions()['sections']:
+        for question in section['questions']:
+            catalog[question['id']] = (
+                section.get('domain', 'unknown'),
+                question.get('weight', 1.0),
+                question.get('critical_item', False)
+            )
+    return catalog
+
+def box_stats(values):
+    """Quartiles and Tukey whisker ends (furthest points within 1.5 IQR) of a series"""
+    q1, median, q3 = values.quantile([0.25, 0.5, 0.75]).tolist()
+    iqr = q3 - q1
+    inside = values[values.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)]
+    return q1, median, q3, float(inside.min()), float(inside.max())
+
 def show_analytics():
     st.subheader("Advanced Analytics")
     
     try:
-        db = db_manager.get_session()
-        
-        from database.models import AssessmentResult, QuestionnaireResponse, GazeData
-        
-        # Risk level trends over time
-        results = db.query(AssessmentResult).order_by(AssessmentResult.created_at).all()
+        db = get_db_manager().get_session()
+        
+        from database.models import Assessment, AssessmentResult, QuestionnaireResponse, GazeAggregate
+        
+        # Risk level trends over time (only the columns the charts use)
+        df = pd.read_sql(
+            select(
+                func.date(AssessmentResult.created_at).label("Date"),
+                func.coalesce(AssessmentResult.risk_level, "unknown").label("Risk Level"),
+                func.coalesce(AssessmentResult.overall_score, 0).label("Overall Score"),
+                func.coalesce(AssessmentResult.confidence_score, 0).label("Confidence")
+            ).order_by(AssessmentResult.created_at),
+            db.connection()
+        )
         
-        if results:
+        if not df.empty:
             st.subheader("Risk Level Trends")
             
-            # Create timeline data
-            timeline_data = []
-            for result in results:
-                timeline_data.append({
-                    "Date": result.created_at.date(),
-                    "Risk Level": result.risk_level or "unknown",
-                    "Overall Score": result.overall_score or 0,
-                    "Confidence": result.confidence_score or 0
-                })
-            
-            df = pd.DataFrame(timeline_data)
+            # Charts get pre-binned counts rather than every result row
+            # Risk level distribution over time
+            risk_counts = df.groupby(["Date", "Risk Level"]).size().reset_index(name="count")
+            fig = px.bar(
+                risk_counts, x="Date", y="count", color="Risk Level",
+                title="Risk Level Distribution Over Time"
+            )
+            st.plotly_chart(fig, use_container_width=True)
             
-            if not df.empty:
-                # Risk level distribution over time
-                fig = px.histogram(
-                    df, x="Date", color="Risk Level",
-                    title="Risk Level Distribution Over Time"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Overall score distribution
-                fig2 = px.histogram(
-                    df, x="Overall Score", nbins=20,
-                    title="Overall Score Distribution"
-                )
-                st.plotly_chart(fig2, use_container_width=True)
+            # Overall score distribution
+            counts, edges = np.histogram(df["Overall Score"], bins=20)
+            fig2 = px.bar(
+                x=(edges[:-1] + edges[1:]) / 2, y=counts,
+                labels={"x": "Overall Score", "y": "count"},
+                title="Overall Score Distribution"
+            )
+            fig2.update_traces(width=edges[1] - edges[0])
+            st.plotly_chart(fig2, use_container_width=True)
         
         # Question response analytics
         st.subheader("Question Response Patterns")
         
-        responses = db.query(QuestionnaireResponse).all()
+        # Legacy per-question rows plus answers stored on the assessment itself
+        legacy_df = pd.read_sql(
+            select(
+                QuestionnaireResponse.question_id.label("Question ID"),
+                func.coalesce(QuestionnaireResponse.domain, "unknown").label("Domain"),
+                QuestionnaireResponse.response_value.label("Response Value"),
+                QuestionnaireResponse.weight.label("Weight"),
+                QuestionnaireResponse.is_critical_item.label("Critical Item")
+            ),
+            db.connection()
+        )
+        answered_assessments = db.query(Assessment.answers).filter(Assessment.answers.isnot(None)).all()
         
-        if responses:
+        if not legacy_df.empty or answered_assessments:
             response_data = []
-            for response in responses:
-                response_data.append({
-                    "Question ID": response.question_id,
-                    "Domain": response.domain or "unknown",
-                    "Response Value": response.response_value,
-                    "Weight": response.weight,
-                    "Critical Item": response.is_critical_item
-                })
+            catalog = get_question_catalog()
+            for (answers,) in answered_assessments:
+                for question_id, value in answers.items():
+                    domain, weight, critical = catalog.get(question_id, ("unknown", 1.0, False))
+                    response_data.append({
+                        "Question ID": question_id,
+                        "Domain": domain,
+                        "Response Value": value,
+                        "Weight": weight,
+                        "Critical Item": critical
+                    })
             
-            response_df = pd.DataFrame(response_data)
+            response_df = pd.concat([legacy_df, pd.DataFrame(response_data, columns=legacy_df.columns)],
+                                    ignore_index=True)
             
             if not response_df.empty:
                 # Average scores by domain
@@ -269,44 +335,44 @@ def show_analytics():
                 # Critical item analysis
                 critical_analysis = response_df.groupby(['Question ID', 'Critical Item'])['Response Value'].mean().reset_index()
                 
-                fig4 = px.box(
-                    response_df, x="Critical Item", y="Response Value",
-                    title="Response Distribution: Critical vs Non-Critical Items"
+                # Box plot from precomputed quartiles/fences instead of every response
+                fig4 = go.Figure()
+                for critical, values in response_df.groupby("Critical Item")["Response Value"]:
+                    q1, median, q3, lower, upper = box_stats(values)
+                    fig4.add_trace(go.Box(
+                        x=[str(critical)], q1=[q1], median=[median], q3=[q3],
+                        lowerfence=[lower], upperfence=[upper], name=str(critical)
+                    ))
+                fig4.update_layout(
+                    title="Response Distribution: Critical vs Non-Critical Items",
+                    xaxis_title="Critical Item", yaxis_title="Response Value", showlegend=False
                 )
                 st.plotly_chart(fig4, use_container_width=True)
         
         # Gaze data analytics
         st.subheader("Gaze Analysis Patterns")
         
-        gaze_data = db.query(GazeData).limit(1000).all()  # Limit for performance
-        
-        if gaze_data:
-            gaze_df_data = []
-            for gaze in gaze_data:
-                gaze_df_data.append({
-                    "Task Type": gaze.task_type or "unknown",
-                    "Eye Contact Score": gaze.eye_contact_score or 0,
-                    "Social Attention Score": gaze.social_attention_score or 0,
-                    "Fixation Duration": gaze.fixation_duration or 0,
-                    "Face Detected": gaze.face_detected
-                })
-            
-            gaze_df = pd.DataFrame(gaze_df_data)
-            
-            if not gaze_df.empty:
-                # Average gaze metrics by task type
-                task_avg = gaze_df.groupby('Task Type').agg({
-                    'Eye Contact Score': 'mean',
-                    'Social Attention Score': 'mean',
-                    'Fixation Duration': 'mean'
-                }).reset_index()
-                
-                fig5 = px.bar(
-                    task_avg.melt(id_vars=['Task Type'], var_name='Metric', value_name='Score'),
-                    x='Task Type', y='Score', color='Metric',
-                    title="Average Gaze Metrics by Task Type"
-                )
-                st.plotly_chart(fig5, use_container_width=True)
+        # Per-frame averages per task type, weighted from the one-second gaze aggregates
+        def weighted_avg(column):
+            return func.sum(func.coalesce(column, 0) * GazeAggregate.samples) / func.sum(GazeAggregate.samples)
+        
+        task_avg = pd.read_sql(
+            select(
+                func.coalesce(GazeAggregate.task_type, "unknown").label("Task Type"),
+                weighted_avg(GazeAggregate.avg_eye_contact).label("Eye Contact Score"),
+                weighted_avg(GazeAggregate.avg_social_attention).label("Social Attention Score"),
+                weighted_avg(GazeAggregate.avg_fixation_duration).label("Fixation Duration")
+            ).group_by("Task Type"),
+            db.connection()
+        )
+        
+        if not task_avg.empty:
+            fig5 = px.bar(
+                task_avg.melt(id_vars=['Task Type'], var_name='Metric', value_name='Score'),
+                x='Task Type', y='Score', color='Metric',
+                title="Average Gaze Metrics by Task Type"
+            )
+            st.plotly_chart(fig5, use_container_width=True)
         
         db.close()
         
@@ -317,19 +383,21 @@ def show_database_management():
     st.subheader("Database Management")
     
     try:
-        db = db_manager.get_session()
+        db = get_db_manager().get_session()
         
         # Table statistics
-        from database.models import User, Assessment, QuestionnaireResponse, GazeData, AssessmentResult
+        from database.models import Assessment, AssessmentResult
         
         st.subheader("Table Statistics")
         
+        counts = get_cached_table_counts()
         table_stats = [
-            ("Users", db.query(User).count()),
-            ("Assessments", db.query(Assessment).count()),
-            ("Questionnaire Responses", db.query(QuestionnaireResponse).count()),
-            ("Gaze Data Points", db.query(GazeData).count()),
-            ("Assessment Results", db.query(AssessmentResult).count())
+            ("Users", counts["users"]),
+            ("Assessments", counts["assessments"]),
+            ("Questionnaire Responses", counts["questionnaire_responses"]),
+            ("Gaze Data Points", counts["gaze_data"]),
+            ("Gaze Aggregates (1s buckets)", counts["gaze_aggregates"]),
+            ("Assessment Results", counts["assessment_results"])
         ]
         
         for table_name, count in table_stats:
@@ -344,21 +412,10 @@ def show_database_management():
             if st.button("🧹 Clean Old Sessions", help="Remove sessions older than 30 days"):
                 try:
                     cutoff_date = datetime.utcnow() - timedelta(days=30)
-                    old_users = db.query(User).filter(User.created_at < cutoff_date).all()
-                    
-                    for user in old_users:
-                        # Delete associated data
-                        assessments = db.query(Assessment).filter(Assessment.user_id == user.id).all()
-                        for assessment in assessments:
-                            db.query(QuestionnaireResponse).filter(QuestionnaireResponse.assessment_id == assessment.id).delete()
-                            db.query(GazeData).filter(GazeData.assessment_id == assessment.id).delete()
-                            db.query(AssessmentResult).filter(AssessmentResult.assessment_id == assessment.id).delete()
-                        
-                        db.query(Assessment).filter(Assessment.user_id == user.id).delete()
-                        db.delete(user)
-                    
-                    db.commit()
-                    st.success(f"Cleaned {len(old_users)} old sessions")
+                    deleted_users = get_db_manager().delete_sessions_before(cutoff_date)
+                    get_cached_statistics.clear()
+                    get_cached_table_counts.clear()
+                    st.success(f"Cleaned {deleted_users} old sessions")
                     
                 except Exception as e:
                     st.error(f"Cleanup failed: {e}")
@@ -367,31 +424,39 @@ def show_database_management():
         with col2:
             if st.button("📊 Export Data", help="Export assessment data as CSV"):
                 try:
-                    # Create export data
-                    export_data = []
-                    
-                    assessments = db.query(Assessment).filter(Assessment.status == "completed").all()
+                    # One result per completed assessment (the first saved, as in the Assessments table)
+                    first_result = (
+                        select(AssessmentResult.assessment_id, func.min(AssessmentResult.id).label("result_id"))
+                        .group_by(AssessmentResult.assessment_id)
+                        .subquery()
+                    )
+                    export_query = (
+                        select(
+                            Assessment.id.label("assessment_id"),
+                            Assessment.user_id,
+                            Assessment.completed_at,
+                            (func.coalesce(Assessment.total_duration, 0) // 60).label("duration_minutes"),
+                            AssessmentResult.risk_level,
+                            AssessmentResult.overall_score,
+                            AssessmentResult.confidence_score
+                        )
+                        .join(first_result, first_result.c.assessment_id == Assessment.id)
+                        .join(AssessmentResult, AssessmentResult.id == first_result.c.result_id)
+                        .where(Assessment.status == "completed")
+                    )
                     
-                    for assessment in assessments:
-                        result = db.query(AssessmentResult).filter(AssessmentResult.assessment_id == assessment.id).first()
-                        if result:
-                            export_data.append({
-                                "assessment_id": assessment.id,
-                                "user_id": assessment.user_id,
-                                "completed_at": assessment.completed_at,
-                                "duration_minutes": assessment.total_duration // 60 if assessment.total_duration else 0,
-                                "risk_level": result.risk_level,
-                                "overall_score": result.overall_score,
-                                "confidence_score": result.confidence_score
-                            })
+                    # Rows are fetched in chunks, but st.download_button needs the whole
+                    # file, so the CSV text itself is still assembled in memory
+                    buffer = io.StringIO()
+                    exported_rows = 0
+                    for chunk in pd.read_sql(export_query, db.connection(), chunksize=5000):
+                        chunk.to_csv(buffer, index=False, header=exported_rows == 0)
+                        exported_rows += len(chunk)
                     
-                    if export_data:
-                        export_df = pd.DataFrame(export_data)
-                        csv = export_df.to_csv(index=False)
-                        
+                    if exported_rows:
                         st.download_button(
                             label="Download CSV",
-                            data=csv,
+                            data=buffer.getvalue(),
                             file_name=f"asd_assessment_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                             mime="text/csv"
                         )
@@ -414,16 +479,31 @@ def show_database_management():
         if st.button("Execute Query"):
             if sql_query.strip():
                 try:
-                    result = db.execute(sql_query)
+                    conn = db.connection()
+                    if conn.dialect.name == "postgresql":
+                        # Bound to this transaction, so a runaway query can't hold the app
+                        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {SQL_QUERY_TIMEOUT_MS}")
+                    is_select = sql_query.strip().upper().startswith("SELECT")
+                    # Passed to the driver verbatim, so ':name' and '%' aren't taken as parameters;
+                    # SELECTs use a server-side cursor so only the displayed rows are pulled into
+                    # memory (Postgres can't DECLARE a cursor for UPDATE/DELETE)
+                    result = conn.exec_driver_sql(
+                        sql_query,
+                        execution_options={"no_parameters": True, "stream_results": is_select}
+                    )
                     
-                    if sql_query.strip().upper().startswith("SELECT"):
-                        rows = result.fetchall()
+                    if is_select:
+                        rows = result.fetchmany(SQL_QUERY_ROW_LIMIT)
                         if rows:
                             columns = result.keys()
                             query_df = pd.DataFrame(rows, columns=columns)
+                            if len(rows) == SQL_QUERY_ROW_LIMIT:
+                                st.warning(f"Showing the first {SQL_QUERY_ROW_LIMIT} rows only")
                             st.dataframe(query_df, use_container_width=True)
                         else:
                             st.info("Query returned no results")
+                        result.close()
+                        db.rollback()  # end the read transaction
                     else:
                         db.commit()
                         st.success("Query executed successfully")
@@ -1,16 +1,106 @@
 import streamlit as st
-import cv2
 import numpy as np
 import time
-import plotly.express as px
+from copy import copy
+from concurrent.futures import ThreadPoolExecutor
 import plotly.graph_objects as go
-from utils.demo_mode import demo_simulator, show_demo_mode_info, create_demo_video_frame
-from database.models import db_manager
+from utils.demo_mode import get_demo_simulator, show_demo_mode_info, create_demo_video_frame
+from database.models import get_db_manager
+
+# Seconds between refreshes of the running phase's timer, metrics and gaze point
+DEMO_TICK_SECONDS = 0.25
+
+# Simulated gaze points plotted per tick
+DEMO_GAZE_POINTS_PER_TICK = 1
+
+# Simulated attention points gained per second of a running phase
+FACE_ATTENTION_RATE = 8
+OBJECT_ATTENTION_RATE = 3
+
+_RNG = np.random.default_rng()
+
+# Shared by all sessions so demo result writes never block a rerun
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Session state the demo test starts from
+_DEFAULTS = {
+    'demo_face_test_phase': 0,
+    'demo_face_test_active': False,
+    'demo_face_test_results': {},
+    'demo_start_time': None,
+    '_pending_db_writes': [],
+    '_db_flushed': False,
+    '_db_future': None,
+}
+
+# Static parts of the live gaze figure
+_FACE_RECT = dict(type="rect", x0=50, y0=100, x1=350, y1=400,
+                  line=dict(color="blue", width=2), name="Face Region")
+_OBJECT_RECT = dict(type="rect", x0=450, y0=100, x1=750, y1=400,
+                    line=dict(color="red", width=2), name="Object Region")
+_GAZE_LAYOUT = dict(
+    title="Real-time Gaze Tracking (Demo)",
+    xaxis=dict(range=[0, 800], title="X Position"),
+    yaxis=dict(range=[0, 600], title="Y Position"),
+    height=300
+)
+
+# Static stimulus markup, built once at import instead of on every rerun
+FACE_OBJECT_GRID_HTML = """
+<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 20px;'>
+    <div style='text-align: center; padding: 40px; border: 3px solid blue; border-radius: 10px; background-color: #f0f8ff;'>
+        <div style='font-size: 120px;'>😊</div>
+        <h3>Human Face</h3>
+        <p style='color: blue;'>Face Region (Tracked)</p>
+    </div>
+    <div style='text-align: center; padding: 40px; border: 3px solid red; border-radius: 10px; background-color: #fff0f0;'>
+        <div style='font-size: 120px;'>🚗</div>
+        <h3>Object</h3>
+        <p style='color: red;'>Object Region (Tracked)</p>
+    </div>
+</div>
+"""
+
+MULTIPLE_FACES_HTML = """
+<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; padding: 20px; border: 2px solid green; border-radius: 15px;'>
+    <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
+        <div style='font-size: 60px;'>😀</div>
+    </div>
+    <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
+        <div style='font-size: 60px;'>😃</div>
+    </div>
+    <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
+        <div style='font-size: 60px;'>😄</div>
+    </div>
+    <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
+        <div style='font-size: 60px;'>😁</div>
+    </div>
+    <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
+        <div style='font-size: 60px;'>😆</div>
+    </div>
+    <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
+        <div style='font-size: 60px;'>😊</div>
+    </div>
+</div>
+<p style='text-align: center; margin-top: 10px;'><strong>Multiple Faces - Natural Scanning Pattern (Demo)</strong></p>
+"""
+
+EYE_CONTACT_HTML = """
+<div style='text-align: center; padding: 60px; background: linear-gradient(45deg, #e3f2fd, #bbdefb); border-radius: 15px; border: 3px solid #2196f3;'>
+    <div style='font-size: 150px; margin-bottom: 20px;'>👁️</div>
+    <h2>Eye Contact Demo</h2>
+    <p style='font-size: 18px;'>Simulated natural eye contact patterns</p>
+    <div style='margin-top: 20px; color: #1976d2;'>
+        <strong>Demo: Tracking eye contact duration and frequency</strong>
+    </div>
+</div>
+"""
 
 def show_demo_face_recognition_test():
     st.header("👁️ Face Recognition Test (Demo Mode)")
     
     show_demo_mode_info()
+    st.sidebar.checkbox("Show gaze coordinates", key="show_gaze_debug")
     
     st.markdown("""
     This test demonstrates how gaze patterns are analyzed when viewing human faces compared to objects.
@@ -40,14 +130,14 @@ def show_demo_face_recognition_test():
     ]
     
     # Initialize test state
-    if 'demo_face_test_phase' not in st.session_state:
-        st.session_state.demo_face_test_phase = 0
-    if 'demo_face_test_active' not in st.session_state:
-        st.session_state.demo_face_test_active = False
-    if 'demo_face_test_results' not in st.session_state:
-        st.session_state.demo_face_test_results = {}
-    if 'demo_start_time' not in st.session_state:
-        st.session_state.demo_start_time = None
+    ss = st.session_state
+    for key, value in _DEFAULTS.items():
+        ss.setdefault(key, copy(value))
+    
+    # Read the state once; every handler that changes it ends in st.rerun()
+    active = ss.demo_face_test_active
+    phase_idx = ss.demo_face_test_phase
+    start = ss.demo_start_time
     
     col1, col2 = st.columns([2, 1])
     
@@ -58,8 +148,8 @@ def show_demo_face_recognition_test():
         demo_video_placeholder = st.empty()
         
         # Show current stimulus
-        if st.session_state.demo_face_test_active and st.session_state.demo_face_test_phase < len(test_phases):
-            current_phase = test_phases[st.session_state.demo_face_test_phase]
+        if active and phase_idx < len(test_phases):
+            current_phase = test_phases[phase_idx]
             
             with demo_video_placeholder.container():
                 st.markdown(f"### {current_phase['name']}")
@@ -77,117 +167,152 @@ def show_demo_face_recognition_test():
         st.subheader("Demo Controls")
         
         # Current phase info
-        if st.session_state.demo_face_test_phase < len(test_phases):
-            current_phase = test_phases[st.session_state.demo_face_test_phase]
+        if phase_idx < len(test_phases):
+            current_phase = test_phases[phase_idx]
             st.info(f"**Current Phase:** {current_phase['name']}")
             st.write(f"**Description:** {current_phase['description']}")
             st.write(f"**Duration:** {current_phase['duration']} seconds")
         
         # Progress
-        progress = st.session_state.demo_face_test_phase / len(test_phases)
+        progress = phase_idx / len(test_phases)
         st.progress(progress)
-        st.write(f"Progress: {st.session_state.demo_face_test_phase}/{len(test_phases)} phases completed")
+        st.write(f"Progress: {phase_idx}/{len(test_phases)} phases completed")
         
-        # Timer display
-        if st.session_state.demo_face_test_active and st.session_state.demo_start_time:
-            elapsed = time.time() - st.session_state.demo_start_time
-            current_phase = test_phases[st.session_state.demo_face_test_phase]
-            remaining = max(0, current_phase['duration'] - elapsed)
-            st.metric("Time Remaining", f"{remaining:.1f}s")
-            
-            # Auto-complete phase when time is up
-            if remaining <= 0:
-                complete_demo_phase()
-                st.rerun()
+        # Timer and live metrics refresh on their own while a phase runs
+        if active and start is not None:
+            _tick_demo(test_phases)
         
         # Control buttons
         col_start, col_stop = st.columns(2)
         
         with col_start:
-            if st.button("▶️ Start Phase", disabled=st.session_state.demo_face_test_active):
-                if st.session_state.demo_face_test_phase < len(test_phases):
-                    st.session_state.demo_face_test_active = True
-                    st.session_state.demo_start_time = time.time()
-                    demo_simulator.start_demo("face_recognition")
+            if st.button("▶️ Start Phase", disabled=active):
+                if phase_idx < len(test_phases):
+                    ss.demo_face_test_active = True
+                    ss.demo_start_time = time.monotonic()
+                    ss._demo_fig = build_demo_gaze_figure()
+                    get_demo_simulator().start_demo("face_recognition")
                     st.success("Demo phase started!")
                     st.rerun()
         
         with col_stop:
-            if st.button("⏹️ Stop Phase", disabled=not st.session_state.demo_face_test_active):
-                if st.session_state.demo_face_test_active:
+            if st.button("⏹️ Stop Phase", disabled=not active):
+                if active:
                     complete_demo_phase()
                     st.rerun()
         
-        # Show live demo metrics
-        if st.session_state.demo_face_test_active:
-            st.markdown("**Live Demo Metrics:**")
-            
-            # Generate live stats
-            elapsed = time.time() - st.session_state.demo_start_time if st.session_state.demo_start_time else 0
-            face_attention = int(elapsed * 8)  # Simulate growing attention
-            object_attention = int(elapsed * 3)
-            
-            st.metric("Face Attention", face_attention)
-            st.metric("Object Attention", object_attention)
-            
-            if face_attention + object_attention > 0:
-                face_pref = face_attention / (face_attention + object_attention)
-                st.metric("Face Preference", f"{face_pref:.1%}")
-        
         # Navigation
         st.markdown("---")
         col_back, col_next = st.columns(2)
         
         with col_back:
             if st.button("⬅️ Back to Overview"):
-                st.session_state.current_test = 0
+                ss.current_test = 0
                 st.rerun()
         
         with col_next:
-            if st.session_state.demo_face_test_phase >= len(test_phases):
+            if phase_idx >= len(test_phases):
                 if st.button("Next Test ➡️", type="primary"):
-                    st.session_state.current_test = 2
+                    ss.current_test = 2
                     st.rerun()
         
         # Results summary
-        if st.session_state.demo_face_test_phase >= len(test_phases):
+        if phase_idx >= len(test_phases):
+            _flush_db_writes()
             st.success("✅ Demo Face Recognition Test Completed!")
             
             with st.expander("📊 Demo Results", expanded=True):
                 show_demo_face_test_summary()
 
+@st.fragment(run_every=DEMO_TICK_SECONDS)
+def _tick_demo(test_phases):
+    """Timer and live metrics for the running phase; reruns alone instead of the whole page"""
+    if not st.session_state.demo_face_test_active or st.session_state.demo_start_time is None:
+        return
+    
+    elapsed = time.monotonic() - st.session_state.demo_start_time
+    current_phase = test_phases[st.session_state.demo_face_test_phase]
+    remaining = max(0, current_phase['duration'] - elapsed)
+    st.metric("Time Remaining", f"{remaining:.1f}s")
+    
+    # Auto-complete phase when time is up; the full rerun refreshes progress and controls
+    if remaining <= 0:
+        complete_demo_phase()
+        st.rerun()
+    
+    # Show live demo metrics
+    st.markdown("**Live Demo Metrics:**")
+    
+    # Live stats are a pure function of the one elapsed reading above
+    face_attention = int(elapsed * FACE_ATTENTION_RATE)
+    object_attention = int(elapsed * OBJECT_ATTENTION_RATE)
+    
+    st.metric("Face Attention", face_attention)
+    st.metric("Object Attention", object_attention)
+    
+    total = face_attention + object_attention
+    st.metric("Face Preference", f"{face_attention / max(1, total):.1%}")
+
 def complete_demo_phase():
     """Complete current demo phase and generate results"""
     # Generate demo results
-    demo_results = demo_simulator.stop_demo()
+    demo_results = get_demo_simulator().stop_demo()
     
     # Add some randomization for realistic results
+    face_time, object_time = _RNG.integers([180, 60], [250, 120]).tolist()
+    preference, detection_rate = _RNG.uniform([0.6, 0.85], [0.8, 0.95]).tolist()
     demo_results.update({
-        'face_attention_time': np.random.randint(180, 250),
-        'object_attention_time': np.random.randint(60, 120),
-        'face_preference_ratio': np.random.uniform(0.6, 0.8),
-        'face_detection_rate': np.random.uniform(0.85, 0.95)
+        'face_attention_time': face_time,
+        'object_attention_time': object_time,
+        'face_preference_ratio': preference,
+        'face_detection_rate': detection_rate
     })
     
     st.session_state.demo_face_test_results[f"phase_{st.session_state.demo_face_test_phase}"] = demo_results
     st.session_state.demo_face_test_active = False
     st.session_state.demo_face_test_phase += 1
     st.session_state.demo_start_time = None
+    st.session_state.pop('_demo_fig', None)
     
-    # Save to database if assessment exists
-    try:
-        if st.session_state.assessment_id:
-            db_manager.save_gaze_data_batch(
-                st.session_state.assessment_id,
-                f"demo_face_recognition_phase_{st.session_state.demo_face_test_phase-1}",
-                "face_recognition_demo",
-                demo_results
-            )
-    except Exception as e:
-        st.error(f"Error saving demo data: {e}")
+    # Queue for the database; written once all phases are done
+    st.session_state._pending_db_writes.append(
+        (f"demo_face_recognition_phase_{st.session_state.demo_face_test_phase-1}", demo_results)
+    )
     
     st.success("Demo phase completed!")
 
+def _save_pending_writes(assessment_id, pending):
+    """Worker: save queued phase results, dropping each entry once it is written"""
+    while pending:
+        task_name, demo_results = pending[0]
+        get_db_manager().save_gaze_data_batch(
+            assessment_id,
+            task_name,
+            "face_recognition_demo",
+            demo_results
+        )
+        pending.pop(0)
+
+def _flush_db_writes():
+    """Save the queued phase results in the background once the test is finished"""
+    future = st.session_state._db_future
+    if future is not None:
+        # Never wait on the write; pick up its outcome on a later rerun
+        if not future.done():
+            return
+        st.session_state._db_future = None
+        if future.exception() is not None:
+            st.error(f"Error saving demo data: {future.exception()}")
+        else:
+            st.session_state._db_flushed = True
+        return
+    
+    if st.session_state._db_flushed or not st.session_state.get('assessment_id'):
+        return
+    st.session_state._db_future = _DB_EXECUTOR.submit(
+        _save_pending_writes, st.session_state.assessment_id, st.session_state._pending_db_writes
+    )
+
 def show_demo_stimulus_with_gaze(stimulus_type):
     """Show demo stimulus with simulated gaze tracking"""
     
@@ -199,105 +324,86 @@ def show_demo_stimulus_with_gaze(stimulus_type):
         show_demo_eye_contact_stimulus()
     
     # Add simulated gaze overlay
+    if st.session_state.demo_face_test_active:
+        _tick_demo_gaze()
+
+@st.fragment(run_every=DEMO_TICK_SECONDS)
+def _tick_demo_gaze():
+    """Simulated gaze point and plot; reruns alone on each tick"""
     if st.session_state.demo_face_test_active:
         st.markdown("**🔴 Simulated Gaze Point**")
         
-        # Generate demo gaze coordinates
-        gaze_x, gaze_y = demo_simulator.get_simulated_gaze_point()
-        
-        # Show gaze metrics
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Gaze X", f"{gaze_x:.0f}")
-        with col2:
-            st.metric("Gaze Y", f"{gaze_y:.0f}")
-        
-        # Create simple visualization
-        fig = go.Figure()
-        
-        # Add stimulus regions
-        fig.add_shape(type="rect", x0=50, y0=100, x1=350, y1=400,
-                     line=dict(color="blue", width=2), name="Face Region")
-        fig.add_shape(type="rect", x0=450, y0=100, x1=750, y1=400,
-                     line=dict(color="red", width=2), name="Object Region")
+        # Generate demo gaze coordinates; several points per tick come from one batched draw
+        if DEMO_GAZE_POINTS_PER_TICK > 1:
+            points = get_demo_simulator().get_simulated_gaze_points(DEMO_GAZE_POINTS_PER_TICK)
+            xs, ys = points[:, 0], points[:, 1]
+            gaze_x, gaze_y = points[-1]
+        else:
+            gaze_x, gaze_y = get_demo_simulator().get_simulated_gaze_point()
+            xs, ys = [gaze_x], [gaze_y]
         
-        # Add gaze point
-        fig.add_scatter(x=[gaze_x], y=[gaze_y], mode='markers',
-                       marker=dict(size=15, color='green'), name='Gaze Point')
+        # Raw coordinates are debug output; skip the two widgets unless asked for
+        if st.session_state.get('show_gaze_debug'):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Gaze X", f"{gaze_x:.0f}")
+            with col2:
+                st.metric("Gaze Y", f"{gaze_y:.0f}")
         
-        fig.update_layout(
-            title="Real-time Gaze Tracking (Demo)",
-            xaxis=dict(range=[0, 800], title="X Position"),
-            yaxis=dict(range=[0, 600], title="Y Position"),
-            height=300
-        )
+        # Reuse the phase's figure and only move the gaze point
+        fig = st.session_state.get('_demo_fig')
+        if fig is None:
+            fig = st.session_state._demo_fig = build_demo_gaze_figure()
+        fig.data[-1].update(x=xs, y=ys)
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="demo_gaze_chart")
 
-def show_demo_face_object_stimulus():
-    """Display face vs object stimulus (demo version)"""
-    col1, col2 = st.columns(2)
+def build_demo_gaze_figure():
+    """Build the static gaze tracking figure once per phase"""
+    fig = go.Figure()
     
-    with col1:
-        face_html = """
-        <div style='text-align: center; padding: 40px; border: 3px solid blue; border-radius: 10px; background-color: #f0f8ff;'>
-            <div style='font-size: 120px;'>😊</div>
-            <h3>Human Face</h3>
-            <p style='color: blue;'>Face Region (Tracked)</p>
-        </div>
-        """
-        st.markdown(face_html, unsafe_allow_html=True)
+    # Add stimulus regions
+    fig.add_shape(**_FACE_RECT)
+    fig.add_shape(**_OBJECT_RECT)
     
-    with col2:
-        object_html = """
-        <div style='text-align: center; padding: 40px; border: 3px solid red; border-radius: 10px; background-color: #fff0f0;'>
-            <div style='font-size: 120px;'>🚗</div>
-            <h3>Object</h3>
-            <p style='color: red;'>Object Region (Tracked)</p>
-        </div>
-        """
-        st.markdown(object_html, unsafe_allow_html=True)
+    # Add gaze point
+    fig.add_scatter(x=[400], y=[300], mode='markers',
+                   marker=dict(size=15, color='green'), name='Gaze Point')
+    
+    fig.update_layout(**_GAZE_LAYOUT)
+    return fig
+
+def show_demo_face_object_stimulus():
+    """Display face vs object stimulus (demo version)"""
+    st.markdown(FACE_OBJECT_GRID_HTML, unsafe_allow_html=True)
 
 def show_demo_multiple_faces_stimulus():
     """Display multiple faces stimulus (demo version)"""
-    faces_html = """
-    <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; padding: 20px; border: 2px solid green; border-radius: 15px;'>
-        <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
-            <div style='font-size: 60px;'>😀</div>
-        </div>
-        <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
-            <div style='font-size: 60px;'>😃</div>
-        </div>
-        <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
-            <div style='font-size: 60px;'>😄</div>
-        </div>
-        <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
-            <div style='font-size: 60px;'>😁</div>
-        </div>
-        <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
-            <div style='font-size: 60px;'>😆</div>
-        </div>
-        <div style='text-align: center; border: 2px solid green; border-radius: 10px; padding: 20px;'>
-            <div style='font-size: 60px;'>😊</div>
-        </div>
-    </div>
-    <p style='text-align: center; margin-top: 10px;'><strong>Multiple Faces - Natural Scanning Pattern (Demo)</strong></p>
-    """
-    st.markdown(faces_html, unsafe_allow_html=True)
+    st.markdown(MULTIPLE_FACES_HTML, unsafe_allow_html=True)
 
 def show_demo_eye_contact_stimulus():
     """Display eye contact stimulus (demo version)"""
-    eye_contact_html = """
-    <div style='text-align: center; padding: 60px; background: linear-gradient(45deg, #e3f2fd, #bbdefb); border-radius: 15px; border: 3px solid #2196f3;'>
-        <div style='font-size: 150px; margin-bottom: 20px;'>👁️</div>
-        <h2>Eye Contact Demo</h2>
-        <p style='font-size: 18px;'>Simulated natural eye contact patterns</p>
-        <div style='margin-top: 20px; color: #1976d2;'>
-            <strong>Demo: Tracking eye contact duration and frequency</strong>
-        </div>
-    </div>
-    """
-    st.markdown(eye_contact_html, unsafe_allow_html=True)
+    st.markdown(EYE_CONTACT_HTML, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def _aggregate_demo_results(phase_totals):
+    """Sum (face, object, detection rate) over completed phases"""
+    totals = np.array(phase_totals, dtype=np.float64).reshape(-1, 3).sum(axis=0)
+    return int(totals[0]), int(totals[1]), float(totals[2]), len(phase_totals)
+
+@st.cache_resource(show_spinner=False)
+def _demo_attention_pie(total_face_attention, total_object_attention):
+    """Faces vs objects pie for the demo summary; the figure is shared, not copied, per hit"""
+    # Only needed once all phases are done, so keep it off the page's import path
+    import plotly.express as px
+    
+    attention_data = {
+        'Stimulus': ['Faces', 'Objects'],
+        'Attention Time': [total_face_attention, total_object_attention]
+    }
+    
+    return px.pie(attention_data, values='Attention Time', names='Stimulus',
+                 title="Demo Results: Faces vs Objects Attention Distribution")
 
 def show_demo_face_test_summary():
     """Display summary of demo face recognition test results"""
@@ -305,18 +411,15 @@ def show_demo_face_test_summary():
         st.write("No demo results available yet.")
         return
     
-    # Aggregate demo results
-    total_face_attention = 0
-    total_object_attention = 0
-    total_detection_rate = 0
-    phases_completed = 0
-    
-    for phase_key, results in st.session_state.demo_face_test_results.items():
-        if results:
-            total_face_attention += results.get('face_attention_time', 0)
-            total_object_attention += results.get('object_attention_time', 0)
-            total_detection_rate += results.get('face_detection_rate', 0)
-            phases_completed += 1
+    # Aggregate demo results; the per-phase key only changes when a phase completes
+    phase_totals = tuple(
+        (results.get('face_attention_time', 0),
+         results.get('object_attention_time', 0),
+         results.get('face_detection_rate', 0))
+        for results in st.session_state.demo_face_test_results.values() if results
+    )
+    total_face_attention, total_object_attention, total_detection_rate, phases_completed = \
+        _aggregate_demo_results(phase_totals)
     
     if phases_completed > 0:
         avg_detection_rate = total_detection_rate / phases_completed
@@ -329,21 +432,11 @@ def show_demo_face_test_summary():
             st.metric("Total Attention Points", total_attention)
         
         with col2:
-            if total_attention > 0:
-                face_preference = total_face_attention / total_attention
-                st.metric("Face Preference", f"{face_preference:.1%}")
-            else:
-                st.metric("Face Preference", "No data")
+            st.metric("Face Preference", f"{total_face_attention / max(1, total_attention):.1%}")
         
         # Demo visualization
         if total_attention > 0:
-            attention_data = {
-                'Stimulus': ['Faces', 'Objects'],
-                'Attention Time': [total_face_attention, total_object_attention]
-            }
-            
-            fig = px.pie(attention_data, values='Attention Time', names='Stimulus',
-                        title="Demo Results: Faces vs Objects Attention Distribution")
+            fig = _demo_attention_pie(total_face_attention, total_object_attention)
             st.plotly_chart(fig, use_container_width=True)
             
             st.success("Demo completed! These results show typical patterns for face recognition assessment.")
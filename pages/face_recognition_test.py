@@ -6,7 +6,8 @@ from streamlit_webrtc import webrtc_streamer, VideoProcessorBase, RTCConfigurati
 import av
 import time
 import threading
-from database.models import db_manager
+from database.models import get_db_manager
+from models.gaze_analyzer import LEFT_EYE_INDICES, RIGHT_EYE_INDICES
 import plotly.express as px
 import plotly.graph_objects as go
 from utils.camera_utils import (
@@ -21,8 +22,9 @@ class FaceRecognitionProcessor(VideoProcessorBase):
         self.mp_face_mesh = mp.solutions.face_mesh
         self.mp_drawing = mp.solutions.drawing_utils
         self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,  # track landmarks between frames instead of re-detecting
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=False,  # only eye-contour landmarks are used, not the iris
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
         )
@@ -108,32 +110,30 @@ class FaceRecognitionProcessor(VideoProcessorBase):
         return results
     
     def recv(self, frame):
-        img = frame.to_ndarray(format="bgr24")
         self.total_frames += 1
         
         if not self.test_active:
-            return av.VideoFrame.from_ndarray(img, format="bgr24")
+            return frame
+        
+        img = frame.to_ndarray(format="bgr24")
         
         # Process every 3rd frame for performance
         if self.frame_count % 3 == 0:
             img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            img_rgb.flags.writeable = False  # lets MediaPipe read the buffer without copying
             results = self.face_mesh.process(img_rgb)
             
             if results.multi_face_landmarks:
                 self.face_detected_frames += 1
                 
                 for face_landmarks in results.multi_face_landmarks:
-                    # Get eye landmarks for gaze estimation
-                    left_eye_indices = [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246]
-                    right_eye_indices = [362, 382, 381, 380, 374, 373, 390, 249, 263, 466, 388, 387, 386, 385, 384, 398]
-                    
                     h, w = img.shape[:2]
                     
                     # Calculate gaze point (simplified estimation)
                     left_eye_center = np.mean([[face_landmarks.landmark[i].x * w, 
-                                              face_landmarks.landmark[i].y * h] for i in left_eye_indices], axis=0)
+                                              face_landmarks.landmark[i].y * h] for i in LEFT_EYE_INDICES], axis=0)
                     right_eye_center = np.mean([[face_landmarks.landmark[i].x * w,
-                                               face_landmarks.landmark[i].y * h] for i in right_eye_indices], axis=0)
+                                               face_landmarks.landmark[i].y * h] for i in RIGHT_EYE_INDICES], axis=0)
                     
                     gaze_x = (left_eye_center[0] + right_eye_center[0]) / 2
                     gaze_y = (left_eye_center[1] + right_eye_center[1]) / 2
@@ -296,7 +296,7 @@ def show_face_recognition_test_page():
                     # Save to database
                     try:
                         if st.session_state.assessment_id:
-                            db_manager.save_gaze_data_batch(
+                            get_db_manager().save_gaze_data_batch(
                                 st.session_state.assessment_id,
                                 f"face_recognition_phase_{st.session_state.face_test_phase-1}",
                                 "face_recognition",
@@ -6,7 +6,11 @@ import av
 import time
 import threading
 from utils.camera_utils import VideoProcessor, get_rtc_configuration, create_assessment_tasks, analyze_task_performance
-from database.models import db_manager
+from database.models import get_db_manager
+from models.gaze_analyzer import DETECTION_INTERVAL, GAZE_DTYPE
+
+# Per-task sample capacity: 20 minutes at 30 fps
+TASK_BUFFER_FRAMES = 30 * 60 * 20
 
 def show_gaze_assessment_page():
     st.header("👁️ Gaze Pattern Assessment")
@@ -51,6 +55,14 @@ def show_gaze_assessment_page():
     # Camera configuration
     st.subheader("Camera Setup")
     
+    detection_interval_ms = st.sidebar.slider(
+        "Face detection interval (ms)",
+        min_value=33,
+        max_value=200,
+        value=int(DETECTION_INTERVAL * 1000),
+        help="How often MediaPipe re-detects the face; frames in between reuse the last landmarks. Lower values need a faster CPU."
+    )
+    
     col1, col2 = st.columns([2, 1])
     
     with col2:
@@ -89,29 +101,46 @@ def show_gaze_assessment_page():
                 def __init__(self):
                     self.video_processor = VideoProcessor()
                     self.task_active = False
-                    self.task_data = []
+                    self.task_data = np.zeros(TASK_BUFFER_FRAMES, dtype=GAZE_DTYPE)
+                    self.task_count = 0
+                    # Analyzer records already copied into task_data (or skipped before the task)
+                    self.consumed_count = 0
                     self.lock = threading.Lock()
                 
                 def recv(self, frame):
                     # Process frame through gaze analyzer
                     processed_frame = self.video_processor.recv(frame)
                     
-                    # Collect data if task is active
+                    # Collect data if task is active; only records the worker produced
+                    # since the last call, so no sample is counted twice
                     if self.task_active:
-                        with self.lock:
-                            gaze_data = self.video_processor.get_analysis_data()
-                            if gaze_data:
-                                self.task_data.extend(gaze_data[-1:])  # Get latest data point
+                        records, self.consumed_count = self.video_processor.get_records_since(self.consumed_count)
+                        if len(records):
+                            with self.lock:
+                                # Ring buffer: keep the newest TASK_BUFFER_FRAMES samples
+                                slots = np.arange(self.task_count, self.task_count + len(records)) % TASK_BUFFER_FRAMES
+                                self.task_data[slots] = records
+                                self.task_count += len(records)
                     
                     return processed_frame
                 
                 def start_task(self):
+                    with self.lock:
+                        self.task_count = 0
+                        self.consumed_count = self.video_processor.analysis_count
                     self.task_active = True
-                    self.task_data = []
                 
                 def stop_task(self):
                     self.task_active = False
-                    return self.task_data.copy()
+                    with self.lock:
+                        if self.task_count <= TASK_BUFFER_FRAMES:
+                            return self.task_data[:self.task_count].copy()
+                        split = self.task_count % TASK_BUFFER_FRAMES
+                        return np.concatenate((self.task_data[split:], self.task_data[:split]))
+                
+                def on_ended(self):
+                    # Stop the inner processor's analysis worker with the stream
+                    self.video_processor.on_ended()
             
             # Create webrtc streamer
             webrtc_ctx = webrtc_streamer(
@@ -119,7 +148,7 @@ def show_gaze_assessment_page():
                 video_processor_factory=GazeAssessmentProcessor,
                 rtc_configuration=rtc_configuration,
                 media_stream_constraints={
-                    "video": {"width": 640, "height": 480},
+                    "video": {"width": 640, "height": 480, "frameRate": {"max": 15}},
                     "audio": False
                 },
                 async_processing=True,
@@ -127,6 +156,8 @@ def show_gaze_assessment_page():
             
             # Task controls
             if webrtc_ctx.video_processor:
+                webrtc_ctx.video_processor.video_processor.gaze_analyzer.detection_interval = detection_interval_ms / 1000
+                
                 col_start, col_stop, col_next = st.columns(3)
                 
                 with col_start:
@@ -145,7 +176,7 @@ def show_gaze_assessment_page():
                             
                             # Save gaze data to database
                             try:
-                                db_manager.save_gaze_data_batch(
+                                get_db_manager().save_gaze_data_batch(
                                     st.session_state.assessment_id,
                                     current_task_name,
                                     current_task['type'],
@@ -224,7 +255,7 @@ def process_all_task_data(task_data_dict, available_tasks):
         # Find task configuration
         task_config = next((task for task in available_tasks if task['name'] == task_name), None)
         
-        if task_config and task_data:
+        if task_config and len(task_data):
             # Analyze task performance
             task_analysis = analyze_task_performance(task_data, task_config['type'])
             
@@ -243,15 +274,16 @@ def process_all_task_data(task_data_dict, available_tasks):
 
 def calculate_overall_gaze_metrics(task_results):
     """Calculate overall gaze metrics across all tasks"""
-    all_data = []
+    task_arrays = []
     
     # Combine data from all tasks
     for task_name, task_result in task_results.items():
         if task_name != 'overall_metrics' and 'raw_data' in task_result:
-            all_data.extend(task_result['raw_data'])
+            task_arrays.append(task_result['raw_data'])
     
-    if not all_data:
+    if not task_arrays:
         return {}
+    all_data = np.concatenate(task_arrays)
     
     # Calculate combined metrics
     from utils.data_processor import DataProcessor
@@ -1,7 +1,7 @@
 import streamlit as st
 import json
 import os
-from database.models import db_manager
+from database.models import get_db_manager
 
 def load_questions():
     """Load questionnaire questions from JSON file"""
@@ -166,7 +166,7 @@ def show_questionnaire_page():
     # Initialize assessment in database if not exists
     if st.session_state.assessment_id is None:
         try:
-            assessment = db_manager.create_assessment(
+            assessment = get_db_manager().create_assessment(
                 st.session_state.user_id, 
                 "questionnaire"
             )
@@ -221,21 +221,6 @@ def show_questionnaire_page():
                         score = 1 if question.get('reverse_scored', False) else 0
                     
                     st.session_state.questionnaire_responses[question_id] = score
-                    
-                    # Save response to database
-                    try:
-                        db_manager.save_questionnaire_response(
-                            st.session_state.assessment_id,
-                            question_id,
-                            question_text,
-                            score,
-                            response,
-                            section.get('domain', 'unknown'),
-                            question.get('weight', 1.0),
-                            question.get('critical_item', False)
-                        )
-                    except Exception as e:
-                        st.error(f"Error saving response: {e}")
                 
                 elif question_type == "likert":
                     response = st.select_slider(
@@ -265,21 +250,6 @@ def show_questionnaire_page():
                     # Normalize to 0-1 scale
                     normalized_score = score / 3.0
                     st.session_state.questionnaire_responses[question_id] = normalized_score
-                    
-                    # Save response to database
-                    try:
-                        db_manager.save_questionnaire_response(
-                            st.session_state.assessment_id,
-                            question_id,
-                            question_text,
-                            normalized_score,
-                            response,
-                            section.get('domain', 'unknown'),
-                            question.get('weight', 1.0),
-                            question.get('critical_item', False)
-                        )
-                    except Exception as e:
-                        st.error(f"Error saving response: {e}")
                 
                 st.divider()
     
@@ -304,8 +274,17 @@ def show_questionnaire_page():
     with col3:
         if answered_questions == total_questions:
             if st.button("Next: Gaze Assessment ➡️", type="primary"):
-                st.session_state.current_step = 2
-                st.rerun()
+                try:
+                    # One UPDATE with every answer; question metadata stays in the catalog
+                    get_db_manager().save_answers(
+                        st.session_state.assessment_id,
+                        dict(st.session_state.questionnaire_responses)
+                    )
+                except Exception as e:
+                    st.error(f"Error saving responses: {e}")
+                else:
+                    st.session_state.current_step = 2
+                    st.rerun()
 
 def show_questionnaire_summary():
     """Display a quick summary of questionnaire responses"""
@@ -2,9 +2,75 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
-from database.models import db_manager
+from database.models import get_db_manager
+from utils.data_processor import lttb_downsample
+
+def decimate_gaze_series(timestamps, values, n_out=2000):
+    """Downsample a gaze metric for plotting, on ms since the task's first sample"""
+    return lttb_downsample((timestamps - timestamps[0]) * 1000, values, n_out)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_task_performance_figure(task_perf):
+    """Build the per-task metric comparison chart (cached across reruns)"""
+    # Create performance comparison
+    tasks = list(task_perf.keys())
+    metrics = ['eye_contact_score', 'social_attention_score', 'face_detection_rate', 'gaze_stability']
+    metric_names = ['Eye Contact', 'Social Attention', 'Face Detection', 'Gaze Stability']
+    
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=metric_names,
+        specs=[[{"type": "bar"}, {"type": "bar"}],
+               [{"type": "bar"}, {"type": "bar"}]]
+    )
+    
+    for i, (metric, name) in enumerate(zip(metrics, metric_names)):
+        row = (i // 2) + 1
+        col = (i % 2) + 1
+        
+        values = [task_perf[task].get(metric, 0) for task in tasks]
+        
+        fig.add_trace(
+            go.Bar(x=tasks, y=values, name=name, showlegend=False),
+            row=row, col=col
+        )
+    
+    fig.update_layout(height=600, title_text="Performance Across Tasks")
+    return fig
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_gaze_timeseries_figure(series):
+    """Build the eye contact / social attention time-series chart (cached across reruns)"""
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=['Eye Contact Over Time', 'Social Attention Over Time'],
+        shared_xaxes=True
+    )
+    
+    for task, raw_data in series.items():
+        # Switch to WebGL rendering for long tasks
+        trace = go.Scattergl if len(raw_data) >= 1000 else go.Scatter
+        
+        time_ms, eye_contact = decimate_gaze_series(raw_data['timestamp'], raw_data['eye_contact_score'])
+        fig.add_trace(
+            trace(x=time_ms, y=eye_contact, 
+                  name=f'{task} - Eye Contact', mode='lines'),
+            row=1, col=1
+        )
+        
+        time_ms, social_attention = decimate_gaze_series(raw_data['timestamp'], raw_data['social_attention_score'])
+        fig.add_trace(
+            trace(x=time_ms, y=social_attention, 
+                  name=f'{task} - Social Attention', mode='lines'),
+            row=2, col=1
+        )
+    
+    fig.update_xaxes(title_text="Time (ms)", row=2, col=1)
+    fig.update_yaxes(title_text="Score", row=1, col=1)
+    fig.update_yaxes(title_text="Score", row=2, col=1)
+    fig.update_layout(height=600, title_text="Gaze Metrics Over Time")
+    return fig
 
 def show_results_page():
     st.header("📊 Assessment Results")
@@ -51,7 +117,7 @@ def show_results_page():
         # Save to database
         try:
             if st.session_state.assessment_id:
-                db_manager.save_assessment_results(
+                get_db_manager().save_assessment_results(
                     st.session_state.assessment_id,
                     questionnaire_data,
                     gaze_data.get('overall_metrics', {}) if gaze_data else {},
@@ -59,7 +125,7 @@ def show_results_page():
                     comprehensive_report.get('risk_assessment', {}),
                     comprehensive_report.get('recommendations', [])
                 )
-                db_manager.complete_assessment(st.session_state.assessment_id)
+                get_db_manager().complete_assessment(st.session_state.assessment_id)
         except Exception as e:
             st.error(f"Error saving results to database: {e}")
     
@@ -99,12 +165,19 @@ def show_results_page():
             st.session_state.current_step = 4
             st.rerun()
 
+@st.cache_resource(show_spinner=False)
+def get_behavioral_model():
+    """Load (or train once) the behavioral ensemble per server process"""
+    from models.behavioral_model import BehavioralModel
+    model = BehavioralModel()
+    model.ensure_trained()
+    return model
+
 def generate_ml_prediction(questionnaire_data, gaze_data):
     """Generate ML prediction from assessment data"""
-    from models.behavioral_model import BehavioralModel
     from utils.data_processor import DataProcessor
     
-    model = BehavioralModel()
+    model = get_behavioral_model()
     processor = DataProcessor()
     
     # Prepare features
@@ -370,75 +443,21 @@ def show_gaze_results(gaze_data):
         
         task_perf = overall_metrics['task_performances']
         
-        # Create performance comparison
-        tasks = list(task_perf.keys())
-        metrics = ['eye_contact_score', 'social_attention_score', 'face_detection_rate', 'gaze_stability']
-        metric_names = ['Eye Contact', 'Social Attention', 'Face Detection', 'Gaze Stability']
-        
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=metric_names,
-            specs=[[{"type": "bar"}, {"type": "bar"}],
-                   [{"type": "bar"}, {"type": "bar"}]]
-        )
-        
-        for i, (metric, name) in enumerate(zip(metrics, metric_names)):
-            row = (i // 2) + 1
-            col = (i % 2) + 1
-            
-            values = [task_perf[task].get(metric, 0) for task in tasks]
-            
-            fig.add_trace(
-                go.Bar(x=tasks, y=values, name=name, showlegend=False),
-                row=row, col=col
-            )
-        
-        fig.update_layout(height=600, title_text="Performance Across Tasks")
+        fig = build_task_performance_figure(task_perf)
         st.plotly_chart(fig, use_container_width=True)
     
     # Gaze pattern visualization
     st.subheader("Gaze Pattern Analysis")
     
     # Time series of key metrics (if available)
-    time_series_data = []
-    for task_name, task_result in gaze_data.items():
-        if task_name != 'overall_metrics' and 'raw_data' in task_result:
-            for i, data_point in enumerate(task_result['raw_data']):
-                time_series_data.append({
-                    'time': i * 33,  # milliseconds
-                    'eye_contact_score': data_point.get('eye_contact_score', 0),
-                    'social_attention_score': data_point.get('social_attention_score', 0),
-                    'task': task_name
-                })
-    
-    if time_series_data:
-        df = pd.DataFrame(time_series_data)
-        
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=['Eye Contact Over Time', 'Social Attention Over Time'],
-            shared_xaxes=True
-        )
-        
-        for task in df['task'].unique():
-            task_data = df[df['task'] == task]
-            
-            fig.add_trace(
-                go.Scatter(x=task_data['time'], y=task_data['eye_contact_score'], 
-                          name=f'{task} - Eye Contact', mode='lines'),
-                row=1, col=1
-            )
-            
-            fig.add_trace(
-                go.Scatter(x=task_data['time'], y=task_data['social_attention_score'], 
-                          name=f'{task} - Social Attention', mode='lines'),
-                row=2, col=1
-            )
-        
-        fig.update_xaxes(title_text="Time (ms)", row=2, col=1)
-        fig.update_yaxes(title_text="Score", row=1, col=1)
-        fig.update_yaxes(title_text="Score", row=2, col=1)
-        fig.update_layout(height=600, title_text="Gaze Metrics Over Time")
+    series = {
+        task_name: task_result['raw_data']
+        for task_name, task_result in gaze_data.items()
+        if task_name != 'overall_metrics' and len(task_result.get('raw_data', ()))
+    }
+    
+    if series:
+        fig = build_gaze_timeseries_figure(series)
         
         st.plotly_chart(fig, use_container_width=True)
 
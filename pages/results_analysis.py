@@ -4,7 +4,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from database.models import db_manager
+from database.models import get_db_manager
 import time
 from datetime import datetime
 
@@ -358,28 +358,34 @@ def show_overall_assessment(analysis):
     for pattern_type, description in analysis['behavioral_patterns'].items():
         st.write(f"**{pattern_type.replace('_', ' ').title()}:** {description}")
 
-def show_detailed_metrics(test_results, analysis):
-    """Display detailed metrics from all tests"""
-    st.subheader("📈 Detailed Test Metrics")
-    
-    # Create metrics comparison chart
+@st.cache_data(ttl=600, show_spinner=False)
+def build_scores_overview_figure(overall_scores):
+    """Build the per-test score bar chart (cached across reruns)"""
     metrics_data = []
     
-    for test_name, scores in analysis['overall_scores'].items():
+    for test_name, scores in overall_scores.items():
         metrics_data.append({
             'Test': test_name.replace('_', ' ').title(),
             'Score': scores,
             'Category': 'Behavioral Assessment'
         })
     
-    if metrics_data:
-        df = pd.DataFrame(metrics_data)
-        
-        fig = px.bar(df, x='Test', y='Score', 
-                    title="Test Scores Overview",
-                    color='Score',
-                    color_continuous_scale='RdYlGn')
-        fig.update_layout(showlegend=False)
+    df = pd.DataFrame(metrics_data)
+    
+    fig = px.bar(df, x='Test', y='Score', 
+                title="Test Scores Overview",
+                color='Score',
+                color_continuous_scale='RdYlGn')
+    fig.update_layout(showlegend=False)
+    return fig
+
+def show_detailed_metrics(test_results, analysis):
+    """Display detailed metrics from all tests"""
+    st.subheader("📈 Detailed Test Metrics")
+    
+    # Create metrics comparison chart
+    if analysis['overall_scores']:
+        fig = build_scores_overview_figure(analysis['overall_scores'])
         st.plotly_chart(fig, use_container_width=True)
     
     # Individual test details
@@ -661,7 +667,7 @@ def save_analysis_to_database(analysis):
     try:
         if st.session_state.assessment_id:
             # Save final results
-            db_manager.save_assessment_results(
+            get_db_manager().save_assessment_results(
                 st.session_state.assessment_id,
                 analysis['overall_scores'],
                 analysis['behavioral_patterns'],
@@ -675,7 +681,7 @@ def save_analysis_to_database(analysis):
             )
             
             # Mark assessment as completed
-            db_manager.complete_assessment(st.session_state.assessment_id)
+            get_db_manager().complete_assessment(st.session_state.assessment_id)
             
     except Exception as e:
         st.error(f"Error saving analysis to database: {e}")
\ No newline at end of file
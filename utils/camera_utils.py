@@ -1,9 +1,13 @@
 import streamlit as st
 import cv2
 import numpy as np
-import av
 from streamlit_webrtc import webrtc_streamer, VideoProcessorBase, RTCConfiguration
 import time
+import threading
+from models.gaze_analyzer import GazeAnalyzer, GAZE_DTYPE
+
+# Capacity of the per-processor gaze ring buffer (~30 s at 30 fps)
+MAX_GAZE_FRAMES = 1000
 
 def get_rtc_configuration():
     """Get WebRTC configuration with multiple fallback options"""
@@ -206,9 +210,54 @@ def create_simple_camera_test():
         """)
 
 class VideoProcessor(VideoProcessorBase):
+    """Gaze processor that only ever analyzes the most recent frame"""
+    
+    def __init__(self):
+        self.gaze_analyzer = GazeAnalyzer()
+        self.analysis_data = np.zeros(MAX_GAZE_FRAMES, dtype=GAZE_DTYPE)
+        self.analysis_count = 0
+        
+        self._latest = None
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._running = True
+        self._worker = threading.Thread(target=self._process_latest_frames, daemon=True)
+        self._worker.start()
+    
     def recv(self, frame):
-        # Convert frame to numpy array
         img = frame.to_ndarray(format="bgr24")
-        # (Optional) Process the image here
-        # For now, just return the frame as-is
-        return av.VideoFrame.from_ndarray(img, format="bgr24")
\ No newline at end of file
+        # Overwrite rather than queue: if MediaPipe is behind, stale frames are dropped
+        with self._lock:
+            self._latest = img
+        self._frame_ready.set()
+        # Nothing is drawn on the image, so hand the original frame straight back
+        return frame
+    
+    def _process_latest_frames(self):
+        """Worker loop: analyze whichever frame is newest, skipping the rest"""
+        while self._running:
+            if not self._frame_ready.wait(timeout=0.5):
+                continue
+            with self._lock:
+                img = self._latest
+                self._latest = None
+                self._frame_ready.clear()
+            if img is None:
+                continue
+            
+            gaze_data = self.gaze_analyzer.process_frame(img)
+            record = tuple(gaze_data[name] for name in GAZE_DTYPE.names)
+            with self._lock:
+                self.analysis_data[self.analysis_count % MAX_GAZE_FRAMES] = record
+                self.analysis_count += 1
+    
+    def get_records_since(self, start):
+        """Get records analyzed after the first `start` ones (oldest first) and the new total"""
+        with self._lock:
+            count = self.analysis_count
+            first = max(start, count - MAX_GAZE_FRAMES)
+            return self.analysis_data[np.arange(first, count) % MAX_GAZE_FRAMES], count
+    
+    def on_ended(self):
+        self._running = False
+        self._frame_ready.set()
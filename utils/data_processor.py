@@ -95,11 +95,17 @@ class DataProcessor:
         return domain_scores
     
     def process_gaze_data(self, gaze_data_list):
-        """Process gaze tracking data into analysis metrics"""
-        if not gaze_data_list:
+        """Process gaze tracking data (list of dicts or structured array) into analysis metrics"""
+        if gaze_data_list is None or len(gaze_data_list) == 0:
             return {}
         
-        df = pd.DataFrame(gaze_data_list)
+        if isinstance(gaze_data_list, np.ndarray):
+            # Column dtypes come straight from the structured dtype, no per-cell inference;
+            # float32 fields are widened so the metrics stay JSON-serializable floats
+            df = pd.DataFrame.from_records(gaze_data_list)
+            df = df.astype({col: np.float64 for col, dtype in df.dtypes.items() if dtype == np.float32})
+        else:
+            df = pd.DataFrame(gaze_data_list)
         
         # Basic statistics
         gaze_metrics = {
@@ -112,7 +118,7 @@ class DataProcessor:
         }
         
         # Only calculate these metrics for frames where face was detected
-        face_detected_df = df[df['face_detected'] == True]
+        face_detected_df = df[df['face_detected'].astype(bool)]
         
         if len(face_detected_df) > 0:
             gaze_metrics.update({
@@ -324,3 +330,32 @@ class DataProcessor:
             viz_data['gaze_metrics'] = gaze_metrics
         
         return viz_data
+
+def lttb_downsample(x, y, n_out=2000):
+    """Decimate a series to n_out points with Largest-Triangle-Three-Buckets"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    
+    prev = 0
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        next_end = edges[b + 2] if b + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean() if next_end > end else x[-1]
+        avg_y = y[end:next_end].mean() if next_end > end else y[-1]
+        
+        # Pick the point forming the largest triangle with the previous pick and next bucket's mean
+        areas = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev]) -
+                       (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(areas))
+        keep[b + 1] = prev
+    
+    return x[keep], y[keep]
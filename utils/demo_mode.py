@@ -12,11 +12,12 @@ class DemoGazeSimulator:
         self.start_time = None
         self.gaze_history = []
         self.current_stimulus = None
+        self.rng = np.random.default_rng()
         
     def start_demo(self, stimulus_type: str):
         """Start demo mode with specified stimulus"""
         self.demo_active = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.current_stimulus = stimulus_type
         self.gaze_history = []
         
@@ -30,7 +31,7 @@ class DemoGazeSimulator:
         if not self.demo_active:
             return frame_width // 2, frame_height // 2
             
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
         
         # Simulate different gaze patterns based on stimulus type
         if self.current_stimulus == "face_recognition":
@@ -44,6 +45,22 @@ class DemoGazeSimulator:
         else:
             return self._simulate_random_gaze(frame_width, frame_height)
     
+    def get_simulated_gaze_points(self, n: int, frame_width: int = 800, frame_height: int = 600) -> np.ndarray:
+        """Generate n gaze points in one draw, as an (n, 2) array of x, y"""
+        if not self.demo_active:
+            return np.tile([frame_width // 2, frame_height // 2], (n, 1)).astype(np.float64)
+        
+        if self.current_stimulus == "face_recognition":
+            # Same face/object split as _simulate_face_gaze, with eye movement noise folded in
+            elapsed_time = time.monotonic() - self.start_time
+            center_x = frame_width * (0.25 if elapsed_time % 4 < 2.5 else 0.75)
+            scale = np.hypot([frame_width * 0.08, frame_height * 0.1], 15)
+            points = self.rng.normal([center_x, frame_height * 0.4], scale, size=(n, 2))
+            return np.clip(points, 0, [frame_width, frame_height], out=points)
+        
+        return self.rng.uniform([frame_width * 0.1, frame_height * 0.1],
+                                [frame_width * 0.9, frame_height * 0.9], size=(n, 2))
+    
     def _simulate_face_gaze(self, width: int, height: int, elapsed_time: float) -> Tuple[float, float]:
         """Simulate gaze patterns typical for face recognition tasks"""
         # Focus more on left side (face region) with some attention to right side (objects)
@@ -221,5 +238,7 @@ def create_demo_video_frame(width: int = 800, height: int = 600) -> np.ndarray:
     
     return frame
 
-# Global demo simulator instance
-demo_simulator = DemoGazeSimulator()
\ No newline at end of file
+@st.cache_resource
+def get_demo_simulator() -> DemoGazeSimulator:
+    """Return the shared demo simulator, created on first use"""
+    return DemoGazeSimulator()
\ No newline at end of file